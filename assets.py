@@ -0,0 +1,40 @@
+"""
+Registro central de texturas.
+
+Cada imagen se decodifica una sola vez y todos los sprites comparten el mismo
+objeto `arcade.Texture`. `preload()` se llama mientras se muestra el menú para
+que cambiar de nivel o dividir al pájaro azul no toque el disco.
+"""
+import logging
+import arcade
+
+logger = logging.getLogger(__name__)
+
+BACKGROUND = "assets/img/background3.png"
+RELOAD = "assets/img/reload.png"
+SLING = "assets/img/sling-3.png"
+RED_BIRD = "assets/img/red-bird3.png"
+YELLOW_BIRD = "assets/img/yellow.png"
+BLUE_BIRD = "assets/img/blue.png"
+PIG = "assets/img/pig_failed.png"
+COLUMN = "assets/img/column.png"
+
+ALL_TEXTURES = (BACKGROUND, RELOAD, SLING, RED_BIRD, YELLOW_BIRD, BLUE_BIRD, PIG, COLUMN)
+
+_textures = {}
+
+
+def get_texture(path: str) -> arcade.Texture:
+    """Retorna la textura compartida de `path`, cargándola la primera vez."""
+    texture = _textures.get(path)
+    if texture is None:
+        texture = arcade.load_texture(path)
+        _textures[path] = texture
+    return texture
+
+
+def preload(paths=ALL_TEXTURES):
+    """Decodifica de antemano todas las texturas del juego."""
+    for path in paths:
+        get_texture(path)
+    logger.debug(f"{len(_textures)} texturas precargadas")
@@ -0,0 +1,198 @@
+"""
+Benchmarks de la simulación.
+
+Mide, para cada nivel (de `LEVELS` o del paquete activo) y para niveles sintéticos con cientos de
+columnas: el paso de física, el trabajo de `GameView.on_update` (que es
+`World.advance`; el dibujo no se incluye porque necesita ventana), la carga
+y el reinicio del nivel, el costo del callback de colisión pájaro-cerdo y la
+creación de objetos (`Bird`, `BlueBird.split`). El resultado es JSON para
+comparar revisiones:
+
+    python benchmark.py --json antes.json
+    python benchmark.py --json despues.json
+    python benchmark.py --compare antes.json despues.json
+"""
+import argparse
+import json
+import logging
+import math
+import platform
+import statistics
+import subprocess
+import time
+import pymunk
+from game_logic import ImpulseVector
+from levels import LevelData, get_level, get_total_levels
+from world import World, FLOOR_Y
+
+SYNTHETIC_COLUMNS = (100, 300, 600)
+COLUMN_SPACING = 30
+COLUMNS_PER_ROW = 35
+COLUMN_HEIGHT = 90
+NO_IMPULSE = ImpulseVector(0, 0)
+
+
+def synthetic_level(num_columns):
+    """Filas de columnas apiladas con tres cerdos encima."""
+    columns = []
+    for i in range(num_columns):
+        stack, row = i % COLUMNS_PER_ROW, i // COLUMNS_PER_ROW
+        columns.append((400 + stack * COLUMN_SPACING, FLOOR_Y + COLUMN_HEIGHT / 2 + row * COLUMN_HEIGHT))
+    rows = math.ceil(num_columns / COLUMNS_PER_ROW)
+    top = FLOOR_Y + rows * COLUMN_HEIGHT + 30
+    pigs = [(400 + stack * COLUMN_SPACING, top) for stack in (5, 17, 29)]
+    return LevelData(pigs=pigs, columns=columns, description=f"Sintético con {num_columns} columnas")
+
+
+def summarize(samples):
+    """Mediana, p95 y media en milisegundos."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": p95 * 1000,
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "samples": len(ordered),
+    }
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def bench_level(levels, idx, frames, repeat):
+    result = {"columns": len(levels[idx].columns), "pigs": len(levels[idx].pigs)}
+
+    # carga y reinicio del nivel
+    world = World(idx, levels=levels)
+    result["load_level"] = timed(lambda: world.load_level(idx), repeat)
+    result["restart_level"] = timed(world.restart_level, repeat)
+
+    # paso de física puro, con el nivel ya asentado
+    world = World(idx, levels=levels)
+    world.step(60)
+    result["space_step"] = timed(lambda: world.space.step(world.physics_dt), frames)
+
+    # on_update: un pájaro en vuelo y un cuadro de 60 Hz por llamada
+    world = World(idx, levels=levels)
+    world.step(60)
+    world.shoot("red", math.radians(20), 90)
+    result["on_update"] = timed(lambda: world.advance(world.physics_dt), frames)
+
+    # callback de colisión: un pájaro aparece encima de cada cerdo
+    world = World(idx, levels=levels)
+    samples = []
+    callback = world.bird_pig_handler.begin
+
+    def timed_callback(arbiter, space, data):
+        start = time.perf_counter()
+        keep = callback(arbiter, space, data)
+        samples.append(time.perf_counter() - start)
+        return keep
+
+    world.bird_pig_handler.begin = timed_callback
+    for pig in list(world.registry.pigs):
+        x, y = pig.body.position
+        world.create_bird("red", NO_IMPULSE, x + 0.5, y)
+        world.step(1)
+    if samples:
+        result["collision_callback"] = summarize(samples)
+
+    # creación de objetos
+    # cada pájaro se retira después de medirlo, como al terminar un turno
+    world = World(idx, levels=levels)
+    create_samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        bird = world.create_bird("red", NO_IMPULSE, 100, 400)
+        create_samples.append(time.perf_counter() - start)
+        world.remove_object(bird)
+    result["create_bird"] = summarize(create_samples)
+    split_samples = []
+    for _ in range(repeat):
+        world = World(idx, levels=levels)
+        world.shoot("blue", math.radians(45), 90)
+        world.step(10)
+        start = time.perf_counter()
+        world.use_ability()
+        split_samples.append(time.perf_counter() - start)
+    result["blue_bird_split"] = summarize(split_samples)
+    return result
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(frames, repeat, synthetic):
+    results = {}
+    levels = [get_level(idx) for idx in range(get_total_levels())]
+    for idx in range(len(levels)):
+        results[f"level_{idx + 1}"] = bench_level(levels, idx, frames, repeat)
+    for count in synthetic:
+        results[f"synthetic_{count}"] = bench_level([synthetic_level(count)], 0, frames, repeat)
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "pymunk": pymunk.version,
+            "frames": frames,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(old_path, new_path):
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+    print(f"{'escenario':<16} {'métrica':<20} {'antes ms':>10} {'después ms':>11} {'cambio':>8}")
+    for scenario, metrics in new["results"].items():
+        for metric, stats in metrics.items():
+            if not isinstance(stats, dict):
+                continue
+            before = old["results"].get(scenario, {}).get(metric)
+            if not before:
+                continue
+            ratio = stats["median_ms"] / before["median_ms"] if before["median_ms"] else float("inf")
+            print(f"{scenario:<16} {metric:<20} {before['median_ms']:>10.4f} "
+                  f"{stats['median_ms']:>11.4f} {ratio:>7.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de física, carga, colisiones y creación de objetos")
+    parser.add_argument("--frames", type=int, default=300, help="cuadros medidos por escenario")
+    parser.add_argument("--repeat", type=int, default=20, help="repeticiones de carga/creación")
+    parser.add_argument("--synthetic", type=int, nargs="*", default=list(SYNTHETIC_COLUMNS),
+                        help="cantidad de columnas de los niveles sintéticos")
+    parser.add_argument("--json", help="archivo donde guardar los resultados")
+    parser.add_argument("--compare", nargs=2, metavar=("ANTES", "DESPUES"), help="compara dos resultados")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    logging.basicConfig(level=logging.WARNING)
+    report = run(args.frames, args.repeat, args.synthetic)
+    for scenario, metrics in report["results"].items():
+        summary = ", ".join(f"{name}={stats['median_ms']:.3f}ms"
+                            for name, stats in metrics.items() if isinstance(stats, dict))
+        print(f"{scenario}: {summary}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
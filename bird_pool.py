@@ -0,0 +1,58 @@
+"""
+Pool de pájaros reutilizables.
+
+Crear un pájaro cuesta un sprite, un body, una shape y su momento de inercia;
+`BlueBird.split` lo hacía tres veces justo cuando el jugador aprieta SPACE.
+`BirdPool` preasigna pájaros de cada tipo fuera del espacio; `acquire` toma
+uno libre, lo reinicia con `Bird.reset` y lo agrega al espacio, y `release`
+lo saca del espacio y lo deja listo para el próximo lanzamiento. Si un tipo
+se queda sin pájaros libres el pool crece.
+"""
+import pymunk
+from assets import RED_BIRD, YELLOW_BIRD, BLUE_BIRD
+from game_logic import ImpulseVector
+from game_object import Bird, BlueBird, YellowBird
+
+BIRD_TYPES = {
+    "red": (Bird, RED_BIRD),
+    "yellow": (YellowBird, YELLOW_BIRD),
+    "blue": (BlueBird, BLUE_BIRD),
+}
+# el azul se divide en tres, así que necesita cuatro libres para un disparo
+POOL_SIZES = {"red": 2, "yellow": 2, "blue": 4}
+NO_IMPULSE = ImpulseVector(0, 0)
+
+
+class BirdPool:
+
+    def __init__(self, space: pymunk.Space, sizes=POOL_SIZES):
+        self.space = space
+        self.free = {bird_type: [] for bird_type in BIRD_TYPES}
+        self._types = {}  # pájaro -> tipo, para devolverlo a su lista
+        self.created = 0
+        for bird_type, count in sizes.items():
+            for _ in range(count):
+                self.free[bird_type].append(self._create(bird_type))
+
+    def _create(self, bird_type):
+        cls, image = BIRD_TYPES[bird_type]
+        bird = cls(image, NO_IMPULSE, 0, 0, None)
+        self._types[bird] = bird_type
+        self.created += 1
+        return bird
+
+    def acquire(self, bird_type, impulse_vector, x, y):
+        """Un pájaro de `bird_type` en (x, y), lanzado con `impulse_vector` y ya en el espacio."""
+        if bird_type not in BIRD_TYPES:
+            bird_type = "red"
+        free = self.free[bird_type]
+        bird = free.pop() if free else self._create(bird_type)
+        bird.reset(impulse_vector, x, y)
+        self.space.add(bird.body, bird.shape)
+        return bird
+
+    def release(self, bird):
+        """Saca el pájaro del espacio y lo guarda para reutilizarlo."""
+        if bird.body.space is not None:
+            self.space.remove(bird.shape, bird.body)
+        self.free[self._types[bird]].append(bird)
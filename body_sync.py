@@ -0,0 +1,92 @@
+"""
+Sincronización en bloque de cuerpos de pymunk a sprites.
+
+En vez de que cada sprite lea `body.position` y `body.angle` y escriba
+`center_x`/`center_y`/`radians` en su `update`, `SpriteSync` pide a pymunk
+id, posición y ángulo de todos los cuerpos en una sola llamada
+(`pymunk.batch`), los compara con lo último que se copió usando NumPy y solo
+toca los sprites que se movieron. Los cuerpos quietos o dormidos no cuestan
+trabajo en Python, así que el costo por cuadro no crece con la cantidad de
+bloques en reposo.
+"""
+import numpy as np
+
+try:
+    from pymunk.batch import Buffer, BodyFields, get_space_bodies
+except ImportError:  # pymunk < 6.6 no trae la API batch
+    get_space_bodies = None
+
+if get_space_bodies is not None:
+    FIELDS = BodyFields.BODY_ID | BodyFields.POSITION | BodyFields.ANGLE
+
+
+class SpriteSync:
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.buffer = Buffer() if get_space_bodies is not None else None
+        self._version = None
+        self._objects = []                            # alineado con _ids
+        self._ids = np.empty(0, dtype=np.uintp)       # ids de body, ordenados
+        self._last = np.empty((0, 3))                 # x, y, ángulo ya copiados
+
+    def _reindex(self):
+        objects = list(self.registry.by_body.values())
+        ids = np.fromiter((obj.body.id for obj in objects), dtype=np.uintp, count=len(objects))
+        order = np.argsort(ids)
+        last = dict(zip(self._ids.tolist(), self._last))
+        self._ids = ids[order]
+        self._objects = [objects[i] for i in order]
+        # los objetos nuevos arrancan con NaN para que se copien en el próximo sync
+        self._last = np.array([last.get(body_id, (np.nan, np.nan, np.nan)) for body_id in self._ids.tolist()],
+                              dtype=np.float64).reshape(-1, 3)
+        self._version = self.registry.version
+
+    def sync(self, space):
+        """Copia a los sprites la posición y el ángulo de los cuerpos que cambiaron."""
+        if self._version != self.registry.version:
+            self._reindex()
+        if not self._objects:
+            return 0
+        if self.buffer is None:
+            return self._sync_each()
+        self.buffer.clear()
+        get_space_bodies(space, FIELDS, self.buffer)
+        ids = np.frombuffer(self.buffer.int_buf(), dtype=np.uintp)
+        data = np.frombuffer(self.buffer.float_buf(), dtype=np.float64).reshape(-1, 3)
+        # ubicar cada body del espacio en el índice; el piso, las paredes y
+        # los cuerpos de la catapulta no tienen sprite y se descartan
+        idx = np.minimum(np.searchsorted(self._ids, ids), len(self._ids) - 1)
+        known = self._ids[idx] == ids
+        idx, data = idx[known], data[known]
+        changed = np.any(self._last[idx] != data, axis=1)
+        idx, data = idx[changed], data[changed]
+        self._last[idx] = data
+        objects = self._objects
+        for i, (x, y, angle) in zip(idx.tolist(), data.tolist()):
+            obj = objects[i]
+            obj.position = (x, y)
+            obj.radians = angle
+        return len(idx)
+
+    def outside(self, bounds):
+        """
+        Objetos cuyo centro, según la última sincronización, cae fuera de
+        `bounds` (un `pymunk.BB`). Es un filtro previo barato: quien llama
+        confirma con `shape.bb` y con el registro.
+        """
+        if not self._objects:
+            return []
+        x, y = self._last[:, 0], self._last[:, 1]
+        mask = (x < bounds.left) | (x > bounds.right) | (y < bounds.bottom) | (y > bounds.top)
+        objects = self._objects
+        return [objects[i] for i in np.flatnonzero(mask).tolist()]
+
+    def _sync_each(self):
+        for i, obj in enumerate(self._objects):
+            body = obj.body
+            x, y = body.position
+            obj.position = (x, y)
+            obj.radians = body.angle
+            self._last[i] = (x, y, body.angle)
+        return len(self._objects)
@@ -1,6 +1,12 @@
 import arcade
+from arcade.shape_list import ShapeElementList, create_line, create_line_strip, create_polygon
 import pymunk
 import math
+from game_logic import simplify_polyline
+
+RAMP_POINT_SPACING = 8   # px mínimos entre puntos del trazo mientras se arrastra
+RAMP_TOLERANCE = 4       # px de error permitido al simplificar la rampa
+RAMP_RADIUS = 14
 
 class Catapult:
 
@@ -24,6 +30,7 @@ class Catapult:
 
         # Estado del garabato/rampa
         self.counterweight_points = []
+        self.counterweight_last = None   # última posición del mouse, aunque se haya diezmado
         self.counterweight_body = None   # STATIC
         self.counterweight_shapes = []
         self.counterweight_drawing = False
@@ -38,6 +45,14 @@ class Catapult:
         self.bird_joint = None
         self.counterweight_joint = None
 
+        # Geometría de dibujo precalculada: se reconstruye solo cuando cambia
+        # la rampa; el trazo en curso crece de a un segmento
+        self.support_points = []
+        self._static_shapes = None
+        self._static_dirty = True
+        self._stroke_shapes = None
+        self._stroke_drawn = 0
+
         # Longitud del brazo
         self._setup_dummy_visual()
 
@@ -55,6 +70,8 @@ class Catapult:
         support_shape.elasticity = 0.0
         self.space.add(support_body, support_shape)
         self.support_shape = support_shape
+        self.support_points = points
+        self._static_dirty = True
 
     def load_bird(self, bird):
         """
@@ -90,10 +107,17 @@ class Catapult:
     def start_counterweight_draw(self, x, y):
         self.counterweight_drawing = True
         self.counterweight_points = [(x, y)]
+        self.counterweight_last = (x, y)
+        self._stroke_shapes = None
+        self._stroke_drawn = 0
 
     def update_counterweight_draw(self, x, y):
         if self.counterweight_drawing:
-            self.counterweight_points.append((x, y))
+            # diezmar: ignorar movimientos más cortos que RAMP_POINT_SPACING
+            self.counterweight_last = (x, y)
+            lx, ly = self.counterweight_points[-1]
+            if math.hypot(x - lx, y - ly) >= RAMP_POINT_SPACING:
+                self.counterweight_points.append((x, y))
 
     def finish_counterweight_draw(self):
         """
@@ -103,26 +127,55 @@ class Catapult:
 
         self._remove_ramp()
 
+        # el punto donde se soltó el mouse siempre cierra la rampa, aunque
+        # quede a menos de RAMP_POINT_SPACING del último punto guardado
+        if self.counterweight_last is not None and self.counterweight_last != self.counterweight_points[-1]:
+            self.counterweight_points.append(self.counterweight_last)
+
         if len(self.counterweight_points) < 2:
             self.counterweight_ready = False
             return
 
+        # la cantidad de segmentos depende de la forma, no de cuánto duró el arrastre
+        points = simplify_polyline(self.counterweight_points, RAMP_TOLERANCE)
+        self.counterweight_points = points
+
         body = pymunk.Body(body_type=pymunk.Body.STATIC)
 
         shapes = []
-        for i in range(len(self.counterweight_points) - 1):
-            ax, ay = self.counterweight_points[i]
-            bx, by = self.counterweight_points[i + 1]
-            seg = pymunk.Segment(body, (ax, ay), (bx, by), 14)
+        for i in range(len(points) - 1):
+            seg = pymunk.Segment(body, points[i], points[i + 1], RAMP_RADIUS)
             seg.friction = 1.2      # para deslizar poco
             seg.elasticity = 0.1    # poca elasticidad para no “rebotar”
             shapes.append(seg)
+        # vecinos para que el pájaro ruede sin engancharse en las uniones
+        for i, seg in enumerate(shapes):
+            prev_point = points[i - 1] if i > 0 else points[i]
+            next_point = points[i + 2] if i + 2 < len(points) else points[i + 1]
+            seg.set_neighbors(prev_point, next_point)
 
         self.space.add(body, *shapes)
         self.counterweight_body = body
         self.counterweight_shapes = shapes
         self.counterweight_ready = True
         self.counterweight_timer = 0.0
+        self._static_dirty = True
+
+    def reset(self):
+        """Quita la rampa y olvida el pájaro cargado (al reiniciar el nivel)."""
+        self._remove_ramp()
+        self.counterweight_points = []
+        self.counterweight_last = None
+        self.counterweight_drawing = False
+        self.counterweight_ready = False
+        self.counterweight_timer = 0.0
+        self.bird_loaded = None
+        if self.bird_joint:
+            try:
+                self.space.remove(self.bird_joint)
+            except Exception:
+                pass
+        self.bird_joint = None
 
     def _remove_ramp(self):
         if self.counterweight_shapes:
@@ -138,24 +191,36 @@ class Catapult:
             except Exception:
                 pass
         self.counterweight_body = None
+        self._static_dirty = True
 
-    def draw(self):
+    def _build_static_shapes(self):
+        shapes = ShapeElementList()
         # base visual
-        if self.support_shape:
-            s = self.support_shape.get_vertices()
-            arcade.draw_triangle_filled(s[0].x, s[0].y, s[1].x, s[1].y, s[2].x, s[2].y, arcade.color.DARK_BROWN)
-
-        if self.counterweight_drawing and len(self.counterweight_points) > 1:
-            arcade.draw_line_strip(self.counterweight_points, arcade.color.GRAY, 8)
-
+        if self.support_points:
+            shapes.append(create_polygon(self.support_points, arcade.color.DARK_BROWN))
         # rampa estática
         if self.counterweight_shapes:
-            verts = []
-            for seg in self.counterweight_shapes:
-                a = seg.a
-                b = seg.b
-                verts.append((a.x, a.y))
-            if verts:
-                # Conectar en pantalla
-                pts = [seg.a for seg in self.counterweight_shapes] + [self.counterweight_shapes[-1].b]
-                arcade.draw_line_strip([(p.x, p.y) for p in pts], arcade.color.DARK_SLATE_GRAY, 16)
+            pts = [tuple(seg.a) for seg in self.counterweight_shapes] + [tuple(self.counterweight_shapes[-1].b)]
+            shapes.append(create_line_strip(pts, arcade.color.DARK_SLATE_GRAY, 16))
+        self._static_shapes = shapes
+        self._static_dirty = False
+
+    def _grow_stroke(self):
+        # solo se agregan los segmentos nuevos desde el último cuadro
+        if self._stroke_shapes is None:
+            self._stroke_shapes = ShapeElementList()
+            self._stroke_drawn = 1
+        points = self.counterweight_points
+        for i in range(self._stroke_drawn, len(points)):
+            (ax, ay), (bx, by) = points[i - 1], points[i]
+            self._stroke_shapes.append(create_line(ax, ay, bx, by, arcade.color.GRAY, 8))
+        self._stroke_drawn = len(points)
+
+    def draw(self):
+        if self._static_dirty:
+            self._build_static_shapes()
+        self._static_shapes.draw()
+
+        if self.counterweight_drawing and len(self.counterweight_points) > 1:
+            self._grow_stroke()
+            self._stroke_shapes.draw()
@@ -0,0 +1,111 @@
+"""
+Traducción de la entrada del jugador a acciones sobre `World`.
+
+`InputController` recibe los mismos eventos crudos que `GameView` (clicks,
+arrastres, teclas) y decide qué hacer con ellos: apuntar y disparar con la
+resortera, manejar la catapulta, cambiar de pájaro, reiniciar. No depende de
+una ventana, así que una grabación de entradas se puede reproducir sin
+dibujar nada (ver `replay.py`).
+"""
+import logging
+import arcade
+from game_logic import Point2D, get_impulse_vector
+from world import WIDTH, HEIGHT, FLOOR_Y, SLING_START
+
+logger = logging.getLogger(__name__)
+
+SLING_WIDTH, SLING_HEIGHT = 90, 120
+SLING_LEFT = 30                 # margen desde el borde izquierdo
+SLING_BOTTOM = FLOOR_Y + 2      # 2 px por encima del piso
+# Punto fijo de lanzamiento (centro del PNG)
+SLING_ANCHOR = (SLING_LEFT + SLING_WIDTH // 2, SLING_BOTTOM + SLING_HEIGHT // 2)
+SLING_RADIUS = 45               # radio para “agarrar” la resortera
+
+RELOAD_BUTTON_POS = (WIDTH - 60, HEIGHT - 60)
+RELOAD_BUTTON_SIZE = 48
+
+BIRD_KEYS = {
+    arcade.key.KEY_1: "red",
+    arcade.key.KEY_2: "yellow",
+    arcade.key.KEY_3: "blue",
+}
+
+
+class InputController:
+
+    def __init__(self, world):
+        self.world = world
+        self.current_bird_type = "red"
+        self.start_point = Point2D()
+        self.end_point = Point2D()
+        self.draw_line = False
+
+    def on_mouse_press(self, x, y, button, modifiers):
+        # Revisar botón de recarga primero
+        if button != arcade.MOUSE_BUTTON_LEFT:
+            return
+        bx, by = RELOAD_BUTTON_POS
+        s = RELOAD_BUTTON_SIZE // 2
+        if bx - s < x < bx + s and by - s < y < by + s:
+            self.world.score = 0
+            self.restart_level()
+            return
+
+        world = self.world
+        # Modo catapulta
+        if world.catapult_mode:
+            if world.can_launch and not world.catapult_bird_ready:
+                world.load_catapult_bird(self.current_bird_type, x, y)
+            elif world.catapult_bird_ready and not world.catapult.counterweight_ready:
+                world.catapult.start_counterweight_draw(x, y)
+            elif world.catapult_bird_ready and world.catapult.counterweight_ready:
+                world.drop_catapult_bird(x, y, height=400)
+        # Modo resortera
+        elif world.can_launch:
+            dx = x - SLING_ANCHOR[0]
+            dy = y - SLING_ANCHOR[1]
+            if (dx*dx + dy*dy) ** 0.5 <= SLING_RADIUS:
+                self.start_point = Point2D(*SLING_START)
+                self.end_point = Point2D(x, y)
+                self.draw_line = True
+            else:
+                self.draw_line = False
+
+    def on_mouse_drag(self, x, y, buttons):
+        world = self.world
+        if world.catapult_mode and world.catapult_bird_ready and world.catapult.counterweight_drawing:
+            world.catapult.update_counterweight_draw(x, y)
+        elif not world.catapult_mode and buttons == arcade.MOUSE_BUTTON_LEFT and self.draw_line and world.can_launch:
+            self.end_point = Point2D(x, y)
+            logger.debug(f"Dragging to: {self.end_point}")
+
+    def on_mouse_release(self, x, y, button):
+        world = self.world
+        if world.catapult_mode and world.catapult_bird_ready and world.catapult.counterweight_drawing:
+            # terminar de dibujar rampa
+            world.catapult.update_counterweight_draw(x, y)
+            world.catapult.finish_counterweight_draw()
+            logger.debug("Rampa completada")
+        elif not world.catapult_mode:
+            # lanzar con resortera
+            if button == arcade.MOUSE_BUTTON_LEFT and self.draw_line and world.can_launch:
+                logger.debug(f"Lanzando desde resortera: {self.end_point}")
+                self.draw_line = False
+                impulse_vector = get_impulse_vector(self.start_point, self.end_point)
+                world.launch_bird(self.current_bird_type, impulse_vector, x, y)
+                logger.debug("Pajaro lanzado")
+
+    def on_key_press(self, symbol, modifiers):
+        if symbol in BIRD_KEYS:
+            self.current_bird_type = BIRD_KEYS[symbol]
+        elif symbol == arcade.key.C:
+            self.world.toggle_catapult_mode()
+        elif symbol == arcade.key.SPACE:
+            self.world.use_ability()
+        elif symbol == arcade.key.R:
+            logger.debug("Reiniciando nivel")
+            self.restart_level()
+
+    def restart_level(self):
+        self.draw_line = False
+        self.world.restart_level()
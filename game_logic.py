@@ -1,5 +1,6 @@
 import math
 import arcade
+import numpy as np
 from dataclasses import dataclass
 from logging import getLogger
 
@@ -44,4 +45,79 @@ def get_impulse_vector(start_point: Point2D, end_point: Point2D) -> ImpulseVecto
     # Reverse the direction by adding $$\pi$$ for slingshot effect
     opposite_angle = angle + math.pi
     impulse = get_distance(start_point, end_point)
-    return ImpulseVector(opposite_angle, impulse)
\ No newline at end of file
+    return ImpulseVector(opposite_angle, impulse)
+
+
+# Versiones por lotes: reciben arreglos (N, 2) de puntos (o un solo punto que
+# se difunde contra N) y evalúan todos los pares en una llamada vectorizada.
+# Usan las mismas fórmulas que las versiones escalares: las distancias son
+# idénticas y los ángulos pueden diferir en BATCH_ANGLE_TOLERANCE, porque
+# np.arctan2 y math.atan2 pueden redondear distinto el último bit (y sumar
+# pi redondea una vez más). Igualarlos exactamente obligaría a llamar a
+# math.atan2 elemento por elemento.
+BATCH_ANGLE_TOLERANCE = 2 * math.ulp(math.pi)  # radianes, diferencia absoluta máxima
+
+def _deltas(points_a, points_b):
+    a = np.asarray(points_a, dtype=float)
+    b = np.asarray(points_b, dtype=float)
+    delta = b - a
+    return delta[..., 0], delta[..., 1]
+
+
+def get_angle_radians_batch(points_a, points_b) -> np.ndarray:
+    """
+    Como `get_angle_radians` para cada par; cada ángulo difiere del escalar
+    en a lo sumo `BATCH_ANGLE_TOLERANCE` radianes.
+    """
+    dx, dy = _deltas(points_a, points_b)
+    return np.arctan2(dy, dx)
+
+
+def get_distance_batch(points_a, points_b) -> np.ndarray:
+    """Como `get_distance` para cada par, con resultados idénticos."""
+    dx, dy = _deltas(points_a, points_b)
+    return np.sqrt(dx * dx + dy * dy)
+
+
+def get_impulse_vector_batch(start_points, end_points):
+    """
+    Retorna (ángulos, impulsos) como arreglos, igual que `get_impulse_vector`:
+    los impulsos son idénticos y los ángulos difieren en a lo sumo
+    `BATCH_ANGLE_TOLERANCE` radianes.
+    """
+    dx, dy = _deltas(start_points, end_points)
+    angles = np.arctan2(dy, dx) + math.pi
+    impulses = np.sqrt(dx * dx + dy * dy)
+    return angles, impulses
+
+def simplify_polyline(points, tolerance: float):
+    """
+    Simplifica una polilínea con Douglas–Peucker: conserva los extremos y
+    descarta los puntos que se alejan menos de `tolerance` de la recta entre
+    sus vecinos conservados.
+    """
+    if len(points) < 3:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        ax, ay = points[first]
+        bx, by = points[last]
+        dx, dy = bx - ax, by - ay
+        length = math.hypot(dx, dy)
+        max_dist, index = 0.0, None
+        for i in range(first + 1, last):
+            px, py = points[i]
+            if length == 0:
+                dist = math.hypot(px - ax, py - ay)
+            else:
+                dist = abs(dy * (px - ax) - dx * (py - ay)) / length
+            if dist > max_dist:
+                max_dist, index = dist, i
+        if index is not None and max_dist > tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [p for p, k in zip(points, keep) if k]
@@ -1,7 +1,37 @@
 import math
+from typing import Optional
 import arcade
 import pymunk
 from game_logic import ImpulseVector
+from assets import get_texture, COLUMN, PIG
+
+# Parámetros físicos por defecto de los pájaros
+BIRD_MASS = 5
+BIRD_RADIUS = 12
+BIRD_MAX_IMPULSE = 100
+BIRD_POWER_MULTIPLIER = 50
+
+# Categorías de colisión. Las paredes laterales solo chocan con CATEGORY_PIG,
+# así que ninguna otra shape dinámica puede tener ese bit en sus categorías.
+CATEGORY_BIRD = 1 << 0
+CATEGORY_PIG = 1 << 1
+CATEGORY_BLOCK = 1 << 2
+CATEGORY_WALL = 1 << 3
+BIRD_FILTER = pymunk.ShapeFilter(categories=CATEGORY_BIRD)
+PIG_FILTER = pymunk.ShapeFilter(categories=CATEGORY_PIG)
+BLOCK_FILTER = pymunk.ShapeFilter(categories=CATEGORY_BLOCK)
+WALL_FILTER = pymunk.ShapeFilter(categories=CATEGORY_WALL, mask=CATEGORY_PIG)
+
+
+def launch_velocity(
+    impulse_vector: ImpulseVector,
+    mass: float = BIRD_MASS,
+    max_impulse: float = BIRD_MAX_IMPULSE,
+    power_multiplier: float = BIRD_POWER_MULTIPLIER,
+) -> pymunk.Vec2d:
+    """Velocidad inicial de un pájaro lanzado con `impulse_vector`."""
+    impulse = min(max_impulse, impulse_vector.impulse) * power_multiplier
+    return (impulse / mass) * pymunk.Vec2d(1, 0).rotated(impulse_vector.angle)
 
 
 class Bird(arcade.Sprite):
@@ -11,44 +41,63 @@ class Bird(arcade.Sprite):
         impulse_vector: ImpulseVector,
         x: float,
         y: float,
-        space: pymunk.Space,
-        mass: float = 5,
-        radius: float = 12,
-        max_impulse: float = 100,
-        power_multiplier: float = 50,
+        space: Optional[pymunk.Space],
+        mass: float = BIRD_MASS,
+        radius: float = BIRD_RADIUS,
+        max_impulse: float = BIRD_MAX_IMPULSE,
+        power_multiplier: float = BIRD_POWER_MULTIPLIER,
         elasticity: float = 0.8,
         friction: float = 1,
         collision_layer: int = 0,
         life_time: float = 5.0,
     ):
-        super().__init__(image_path, 1)
+        super().__init__(get_texture(image_path), 1)
         moment = pymunk.moment_for_circle(mass, 0, radius)
         body = pymunk.Body(mass, moment)
         body.position = (x, y)
-
-        impulse = min(max_impulse, impulse_vector.impulse) * power_multiplier
-        impulse_pymunk = impulse * pymunk.Vec2d(1, 0)
-        body.apply_impulse_at_local_point(impulse_pymunk.rotated(impulse_vector.angle))
+        body.velocity = launch_velocity(impulse_vector, mass, max_impulse, power_multiplier)
         shape = pymunk.Circle(body, radius)
         shape.elasticity = elasticity
         shape.friction = friction
         shape.collision_type = 1  # collision_type para pájaro
-        space.add(body, shape)
+        shape.filter = BIRD_FILTER
+        if space is not None:  # BirdPool crea pájaros fuera del espacio
+            space.add(body, shape)
         self.body = body
         self.shape = shape
+        self.mass = mass
+        self.moment = moment
+        self.max_impulse = max_impulse
+        self.power_multiplier = power_multiplier
         self.life_time = life_time
         self.time_alive = 0.0
 
-    def update(self, delta_time):
-        self.center_x = self.shape.body.position.x
-        self.center_y = self.shape.body.position.y
-        self.radians = self.shape.body.angle
+    def reset(self, impulse_vector: ImpulseVector, x: float, y: float):
+        """Deja el pájaro como recién creado para volver a lanzarlo (ver BirdPool)."""
+        body = self.body
+        # la catapulta lo pudo haber dejado STATIC
+        if body.body_type != pymunk.Body.DYNAMIC:
+            body.body_type = pymunk.Body.DYNAMIC
+        body.mass = self.mass
+        body.moment = self.moment
+        body.position = (x, y)
+        body.angle = 0
+        body.velocity = launch_velocity(impulse_vector, self.mass, self.max_impulse, self.power_multiplier)
+        body.angular_velocity = 0
+        body.force = (0, 0)
+        body.torque = 0
+        self.position = (x, y)
+        self.radians = 0
+        self.time_alive = 0.0
 
+    def update(self, delta_time):
+        # la posición y el ángulo los copia World con SpriteSync
         self.time_alive += delta_time
-        if self.time_alive >= self.life_time:
-            if self.shape.space is not None:
-                self.shape.space.remove(self.shape, self.body)
-            self.remove_from_sprite_lists()
+
+    @property
+    def expired(self):
+        # el mundo retira al pájaro cuando se acaba su tiempo de vida
+        return self.time_alive >= self.life_time
 
 
 class Pig(arcade.Sprite):
@@ -62,7 +111,7 @@ class Pig(arcade.Sprite):
         friction: float = 0.4,
         collision_layer: int = 0,
     ):
-        super().__init__("assets/img/pig_failed.png", 0.1)
+        super().__init__(get_texture(PIG), 0.1)
         moment = pymunk.moment_for_circle(mass, 0, self.width / 2 - 3)
         body = pymunk.Body(mass, moment)
         body.position = (x, y)
@@ -71,15 +120,11 @@ class Pig(arcade.Sprite):
         shape.elasticity = elasticity
         shape.friction = friction
         shape.collision_type = 2  # collision_type para cerdo
+        shape.filter = PIG_FILTER
         space.add(body, shape)
         self.body = body
         self.shape = shape
 
-    def update(self, delta_time):
-        self.center_x = self.shape.body.position.x
-        self.center_y = self.shape.body.position.y
-        self.radians = self.shape.body.angle
-
 class YellowBird(Bird):
     """
     Yellow bird that can boost its impulse when clicked during flight
@@ -101,6 +146,11 @@ class YellowBird(Bird):
         self.has_boosted = False  # Prevent multiple boosts
         self.is_in_flight = False
 
+    def reset(self, impulse_vector, x, y):
+        super().reset(impulse_vector, x, y)
+        self.has_boosted = False
+        self.is_in_flight = False
+
     def update(self, delta_time):
         super().update(delta_time)
         # Check if bird is in flight
@@ -140,18 +190,27 @@ class BlueBird(Bird):
         self.has_split = False
         self.is_in_flight = False
 
+    def reset(self, impulse_vector, x, y):
+        super().reset(impulse_vector, x, y)
+        self.has_split = False
+        self.is_in_flight = False
+
     def update(self, delta_time):
         super().update(delta_time)
         velocity = self.body.velocity
         self.is_in_flight = velocity.length > 10
 
-    def split(self, sprite_list):
-        """Split into 3 birds with 30-degree separation"""
+    def split(self, spawn):
+        """
+        Split into 3 birds with 30-degree separation. `spawn(impulse_vector, x, y)`
+        returns a blue bird already in the space (World takes it from BirdPool);
+        the caller removes this bird afterwards.
+        """
         if not self.has_split and self.is_in_flight:
             current_velocity = self.body.velocity
             current_position = self.body.position
 
-            if current_velocity.length > 0:
+            if current_velocity.length > 0 and self.body.space is not None:
                 # Get current angle
                 current_angle = math.atan2(current_velocity.y, current_velocity.x)
 
@@ -168,31 +227,17 @@ class BlueBird(Bird):
                         current_velocity.length * math.sin(angle)
                     )
 
-                    # Create new blue bird
-                    space = self.body.space
-                    if space is None:
-                        continue  # Skip creation if space is None
-                    new_bird = BlueBird(
-                        "assets/img/blue.png",
+                    new_bird = spawn(
                         ImpulseVector(angle, current_velocity.length),
                         current_position.x,
                         current_position.y,
-                        space,
-                        mass=self.body.mass,
-                        radius=self.shape.radius
                     )
                     # Set velocity directly instead of applying impulse
                     new_bird.body.velocity = new_velocity
                     new_bird.has_split = True  # Prevent further splitting
                     new_birds.append(new_bird)
-                    sprite_list.append(new_bird)
 
-                # Remove original bird
-                self.remove_from_sprite_lists()
-                if self.shape.space is not None:
-                    self.shape.space.remove(self.shape, self.body)
                 self.has_split = True
-
                 return new_birds
         return []
 
@@ -208,7 +253,7 @@ class PassiveObject(arcade.Sprite):
         friction: float = 1,
         collision_layer: int = 0,
     ):
-        super().__init__(image_path, 1)
+        super().__init__(get_texture(image_path), 1)
 
         moment = pymunk.moment_for_box(mass, (self.width, self.height))
         body = pymunk.Body(mass, moment)
@@ -217,19 +262,15 @@ class PassiveObject(arcade.Sprite):
         shape.elasticity = elasticity
         shape.friction = friction
         shape.collision_type = collision_layer
+        shape.filter = BLOCK_FILTER
         space.add(body, shape)
         self.body = body
         self.shape = shape
 
-    def update(self, delta_time):
-        self.center_x = self.shape.body.position.x
-        self.center_y = self.shape.body.position.y
-        self.radians = self.shape.body.angle
-
 
 class Column(PassiveObject):
     def __init__(self, x, y, space):
-        super().__init__("assets/img/column.png", x, y, space)
+        super().__init__(COLUMN, x, y, space)
 
 
 class StaticObject(arcade.Sprite):
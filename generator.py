@@ -0,0 +1,123 @@
+"""
+Generación masiva de niveles con validación sin ventana.
+
+Cada candidato sale de `levels.generate_level` con una semilla propia
+(`semilla-índice`), así que el mismo comando produce siempre el mismo
+paquete. Los candidatos se validan en un pool de procesos:
+
+  1. el nivel se asienta sin perder cerdos ni dejarlos fuera de la pantalla
+     y termina quieto;
+  2. `ShotSolver` encuentra una secuencia que lo gana con a lo sumo
+     `max_birds` pájaros. La grilla de validación es gruesa: un descarte
+     "inconclusive" dice que no se encontró la victoria, no que no exista.
+
+Los niveles válidos se guardan como paquete (ver `levels.save_level_pack`).
+
+    python generator.py 1000 niveles.alp --workers 8 --seed 7
+"""
+import argparse
+import logging
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+from levels import GeneratorSettings, LevelData, generate_level, save_level_pack
+from solver import UNWINNABLE, SerialExecutor, ShotSolver
+from world import World, WIDTH, HEIGHT
+
+logger = logging.getLogger(__name__)
+
+SETTLE_SECONDS = 3.0
+SETTLED_SPEED = 5.0        # px/s; por encima el nivel sigue moviéndose
+BATCH_PER_WORKER = 4       # candidatos por proceso en cada tanda
+
+
+@dataclass
+class Candidate:
+    index: int
+    level: Optional[LevelData]
+    reason: str               # "ok" o por qué se descartó
+    stars: Optional[int] = None
+
+
+def check_settles(level: LevelData) -> str:
+    """Asienta el nivel y retorna "ok" o el motivo del rechazo."""
+    world = World(0, levels=[level])
+    world.step(int(SETTLE_SECONDS / world.physics_dt))
+    if world.pigs_left != len(level.pigs) or len(world.registry.pigs) != len(level.pigs):
+        return "pierde cerdos al cargar"
+    for pig in world.registry.pigs:
+        x, y = pig.body.position
+        if not (0 <= x <= WIDTH and 0 <= y <= HEIGHT):
+            return "un cerdo sale de la pantalla"
+    for body in world.space.bodies:
+        if body.velocity.length > SETTLED_SPEED:
+            return "no se asienta"
+    return "ok"
+
+
+def validate(job) -> Candidate:
+    """Genera y valida el candidato `index`; corre dentro de un worker."""
+    seed, index, settings, solver_options = job
+    level = generate_level(random.Random(f"{seed}-{index}"), settings)
+    reason = check_settles(level)
+    if reason != "ok":
+        return Candidate(index, None, reason)
+    solver = ShotSolver(SerialExecutor(), levels=[level], **solver_options)
+    report = solver.solve(0)
+    if report["result"] == UNWINNABLE:
+        return Candidate(index, None, "ningún disparo alcanza el nivel")
+    if not report["won"]:
+        return Candidate(index, None, f"no se encontró victoria con {level.max_birds} pájaros")
+    return Candidate(index, level, "ok", report["stars"])
+
+
+def generate(count, seed, executor, workers, settings=GeneratorSettings(), solver_options=None,
+             max_candidates=None):
+    """Valida candidatos por tandas hasta juntar `count` niveles."""
+    solver_options = solver_options or {}
+    max_candidates = max_candidates or count * 20
+    batch = max(1, workers * BATCH_PER_WORKER)
+    accepted, rejected = [], {}
+    index = 0
+    while len(accepted) < count and index < max_candidates:
+        jobs = [(seed, i, settings, solver_options) for i in range(index, min(index + batch, max_candidates))]
+        index += len(jobs)
+        for candidate in executor.map(validate, jobs):
+            if candidate.level is not None:
+                accepted.append(candidate)
+            else:
+                rejected[candidate.reason] = rejected.get(candidate.reason, 0) + 1
+        logger.info(f"{index} candidatos: {len(accepted)} válidos, descartes {rejected}")
+    return [candidate.level for candidate in accepted[:count]], index, rejected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera y valida niveles en paralelo")
+    parser.add_argument("count", type=int, help="niveles válidos a generar")
+    parser.add_argument("path", help="paquete de salida (.json o .alp para binario)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="procesos del pool")
+    parser.add_argument("--max-candidates", type=int, default=None, help="tope de candidatos a probar")
+    parser.add_argument("--angles", type=int, default=10, help="pasos de ángulo del solver de validación")
+    parser.add_argument("--impulses", type=int, default=6, help="pasos de impulso del solver de validación")
+    parser.add_argument("--beam", type=int, default=2, help="haz del solver de validación")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    solver_options = {"angle_steps": args.angles, "impulse_steps": args.impulses, "beam_width": args.beam}
+    workers = args.workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        levels, tried, rejected = generate(args.count, args.seed, executor, workers,
+                                           solver_options=solver_options,
+                                           max_candidates=args.max_candidates)
+    save_level_pack(args.path, levels)
+    print(f"{len(levels)}/{tried} candidatos válidos guardados en {args.path} "
+          f"({time.perf_counter() - start:.1f} s); descartes: {rejected}")
+
+
+if __name__ == "__main__":
+    main()
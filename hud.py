@@ -0,0 +1,80 @@
+"""
+Interfaz en modo retenido.
+
+Los textos del HUD se crean una sola vez dentro de un `Batch` y solo se
+vuelven a maquetar cuando cambia su valor (puntaje, pájaro, modo,
+instrucción, nivel). Todo se dibuja con una única llamada a `batch.draw()`.
+"""
+import arcade
+from pyglet.graphics import Batch
+from world import WIDTH, HEIGHT
+
+
+class Hud:
+
+    def __init__(self, total_levels):
+        self.total_levels = total_levels
+        self.batch = Batch()
+        self._values = {}
+
+        # contador de salida (solo visible mientras se mantiene ESC)
+        self.exit_text = arcade.Text("", WIDTH // 2, HEIGHT // 2, arcade.color.RED, 40,
+                                     anchor_x="center", batch=self.batch)
+        self.exit_text.visible = False
+
+        # info del juego
+        self.level_text = arcade.Text("", 10, HEIGHT - 30, arcade.color.WHITE, 20, batch=self.batch)
+        self.bird_text = arcade.Text("", 10, HEIGHT - 60, arcade.color.WHITE, 20, batch=self.batch)
+        self.mode_text = arcade.Text("", 10, HEIGHT - 90, arcade.color.WHITE, 20, batch=self.batch)
+        self.score_text = arcade.Text("", 700, 750, arcade.color.GOLD, 28, anchor_x="left", batch=self.batch)
+        self.instruction_text = arcade.Text("", 600, 800, arcade.color.YELLOW, 18, batch=self.batch)
+
+        # textos fijos
+        arcade.Text("R: Reiniciar | SPACE: Habilidad especial",
+                    1100, 825, arcade.color.LIGHT_GRAY, 20, batch=self.batch)
+        arcade.Text("Presiona 'R' para reiniciar nivel", WIDTH - 260, 18,
+                    arcade.color.LIGHT_GRAY, 16, batch=self.batch)
+
+        # textos reutilizables para los puntajes flotantes
+        self.popups = []
+
+    def _changed(self, key, value):
+        if self._values.get(key) == value:
+            return False
+        self._values[key] = value
+        return True
+
+    def update(self, level_idx, bird_type, catapult_mode, score, instruction,
+               exit_countdown=None, floating_scores=()):
+        if self._changed("level", level_idx):
+            self.level_text.text = f"Nivel: {level_idx + 1}/{self.total_levels}"
+        if self._changed("bird", bird_type):
+            self.bird_text.text = f"Pájaro: {bird_type.title()} (1-3 para cambiar)"
+        if self._changed("mode", catapult_mode):
+            mode = "Catapulta" if catapult_mode else "Resortera"
+            self.mode_text.text = f"Modo: {mode} (C para cambiar)"
+        if self._changed("score", score):
+            self.score_text.text = f"Puntaje: {score}"
+        if self._changed("instruction", instruction):
+            self.instruction_text.text = instruction
+        if self._changed("exit", exit_countdown):
+            self.exit_text.visible = exit_countdown is not None
+            if exit_countdown is not None:
+                self.exit_text.text = f"Saliendo en {exit_countdown}..."
+        self._update_popups(floating_scores)
+
+    def _update_popups(self, floating_scores):
+        while len(self.popups) < len(floating_scores):
+            self.popups.append(arcade.Text("", 0, 0, arcade.color.GOLD, 32,
+                                           anchor_x="center", anchor_y="center", batch=self.batch))
+        for popup, fs in zip(self.popups, floating_scores):
+            popup.text = f"{fs['value']}"
+            popup.position = (fs['x'], fs['y'])
+            if not popup.visible:
+                popup.visible = True
+        for popup in self.popups[len(floating_scores):]:
+            if popup.visible:
+                popup.visible = False
+
+    def draw(self):
+        self.batch.draw()
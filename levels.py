@@ -1,12 +1,18 @@
 """
 Configuración de niveles para el juego Angry Birds
 """
-from dataclasses import dataclass
-from typing import List, Tuple
+import argparse
+import json
+import os
+import random
+import struct
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
-# Constantes del juego
-WIDTH = 1800
-HEIGHT = 800
+# x de referencia con la que se diseñaron los niveles (centro de un mundo de
+# 1800 px). El tamaño real de la pantalla está en world.WIDTH / world.HEIGHT.
+LEVEL_ORIGIN_X = 900
 
 @dataclass
 class LevelData:
@@ -16,17 +22,18 @@ class LevelData:
     description: str = ""
     max_birds: int = 3
 
-def create_basic_level(pig_count: int, start_x: float) -> LevelData:
+def create_basic_level(pig_count: int, start_x: float = None, spacing: float = 200,
+                       pig_y: float = 100) -> LevelData:
     """nivel básico con el número especificado de cerdos"""
     if start_x is None:
-        start_x = WIDTH // 2
+        start_x = LEVEL_ORIGIN_X
     
     pigs = []
     columns = []
     
     for i in range(pig_count):
-        pig_x = start_x + (i * 200)
-        pigs.append((pig_x, 100))
+        pig_x = start_x + (i * spacing)
+        pigs.append((pig_x, pig_y))
         
         # Agregar columnas alrededor de cada cerdo
         columns.append((pig_x - 50, 50))
@@ -39,16 +46,17 @@ def create_basic_level(pig_count: int, start_x: float) -> LevelData:
         max_birds=min(pig_count + 1, 5)
     )
 
-def create_tower_level(pig_positions: List[Tuple[float, float]]) -> LevelData:
+def create_tower_level(pig_positions: List[Tuple[float, float]], floors: int = 4,
+                       floor_spacing: float = 80, half_gap: float = 30) -> LevelData:
     """Crea un nivel con torres alrededor de los cerdos"""
     columns = []
     
     for pig_x, pig_y in pig_positions:
         # Torre básica alrededor del cerdo
-        tower_height = [50, 130, 210, 290]
+        tower_height = [50 + floor * floor_spacing for floor in range(floors)]
         for height in tower_height:
-            columns.append((pig_x - 30, height))
-            columns.append((pig_x + 30, height))
+            columns.append((pig_x - half_gap, height))
+            columns.append((pig_x + half_gap, height))
     
     return LevelData(
         pigs=pig_positions,
@@ -57,76 +65,265 @@ def create_tower_level(pig_positions: List[Tuple[float, float]]) -> LevelData:
         max_birds=len(pig_positions) + 2
     )
 
-# Definición de niveles del juego (compatible con el código existente)
+
+@dataclass(frozen=True)
+class GeneratorSettings:
+    """Rangos (mínimo, máximo) que recorre `generate_level`"""
+    pig_counts: Tuple[int, int] = (1, 4)
+    tower_floors: Tuple[int, int] = (0, 4)    # 0 = nivel básico sin torres
+    spacing: Tuple[int, int] = (120, 260)
+    start_x: Tuple[int, int] = (700, 1000)
+    max_x: int = 1450                         # último x usable (la pared derecha está en 1510)
+
+
+def generate_level(rng: random.Random, settings: GeneratorSettings = GeneratorSettings()) -> LevelData:
+    """Nivel aleatorio con los generadores básico o de torres"""
+    pig_count = rng.randint(*settings.pig_counts)
+    floors = rng.randint(*settings.tower_floors)
+    start_x = rng.randint(*settings.start_x)
+    # el espaciado se recorta para que el último cerdo quepa en pantalla
+    max_spacing = (settings.max_x - start_x) // max(pig_count - 1, 1)
+    spacing = rng.randint(settings.spacing[0], max(settings.spacing[0], min(settings.spacing[1], max_spacing)))
+    if floors == 0:
+        level = create_basic_level(pig_count, start_x, spacing)
+    else:
+        pigs = [(start_x + i * spacing, 100) for i in range(pig_count)]
+        level = create_tower_level(pigs, floors, floor_spacing=90)
+    level.description = f"{level.description} (x={start_x}, separación={spacing}, pisos={floors})"
+    return level
+
+# Definición de niveles del juego
+X = LEVEL_ORIGIN_X
 LEVELS = [
     # Nivel 1: Introducción
-    {
-        "pigs": [(WIDTH / 2, 100)],
-        "columns": [(WIDTH // 2, 50), (WIDTH // 2 + 400, 50)],
-        "description": "Nivel de introducción - Un cerdo fácil",
-        "max_birds": 2
-    },
-    
+    LevelData(
+        pigs=[(X, 100)],
+        columns=[(X, 50), (X + 400, 50)],
+        description="Nivel de introducción - Un cerdo fácil",
+        max_birds=2,
+    ),
+
     # Nivel 2: Dos objetivos
-    {
-        "pigs": [(WIDTH / 2, 100), (WIDTH / 2 + 200, 100)],
-        "columns": [(WIDTH // 2, 50), (WIDTH // 2 + 200, 50), (WIDTH // 2 + 400, 50)],
-        "description": "Dos cerdos para practicar",
-        "max_birds": 3
-    },
-    
+    LevelData(
+        pigs=[(X, 100), (X + 200, 100)],
+        columns=[(X, 50), (X + 200, 50), (X + 400, 50)],
+        description="Dos cerdos para practicar",
+        max_birds=3,
+    ),
+
     # Nivel 3: Tres objetivos
-    {
-        "pigs": [(WIDTH / 2, 100), (WIDTH / 2 + 200, 100), (WIDTH / 2 + 400, 100)],
-        "columns": [(WIDTH // 2, 50), (WIDTH // 2 + 200, 50), (WIDTH // 2 + 400, 50), (WIDTH // 2 + 600, 50)],
-        "description": "Tres cerdos - aumenta la dificultad",
-        "max_birds": 4
-    },
-    
+    LevelData(
+        pigs=[(X, 100), (X + 200, 100), (X + 400, 100)],
+        columns=[(X, 50), (X + 200, 50), (X + 400, 50), (X + 600, 50)],
+        description="Tres cerdos - aumenta la dificultad",
+        max_birds=4,
+    ),
+
     # Nivel 4: Torres defensivas
-    {
-        "pigs": [(WIDTH / 2, 100), (WIDTH / 2 + 300, 100)],
-        "columns": [
+    LevelData(
+        pigs=[(X, 100), (X + 300, 100)],
+        columns=[
             # Torres alrededor del primer cerdo
-            (WIDTH / 2 - 30, 50), (WIDTH / 2 - 30, 130), (WIDTH / 2 - 30, 210),
-            (WIDTH / 2 + 30, 50), (WIDTH / 2 + 30, 130), (WIDTH / 2 + 30, 210),
-            # Torres alrededor del segundo cerdo  
-            (WIDTH / 2 + 270, 50), (WIDTH / 2 + 270, 130),
-            (WIDTH / 2 + 330, 50), (WIDTH / 2 + 330, 130)
+            (X - 30, 50), (X - 30, 130), (X - 30, 210),
+            (X + 30, 50), (X + 30, 130), (X + 30, 210),
+            # Torres alrededor del segundo cerdo
+            (X + 270, 50), (X + 270, 130),
+            (X + 330, 50), (X + 330, 130)
         ],
-        "description": "Torres defensivas - usa la catapulta",
-        "max_birds": 4
-    },
-    
+        description="Torres defensivas - usa la catapulta",
+        max_birds=4,
+    ),
+
     # Nivel 5: Desafío final
-    {
-        "pigs": [
-            (WIDTH / 2, 100), 
-            (WIDTH / 2 + 200, 100), 
-            (WIDTH / 2 + 400, 100),
-            (WIDTH / 2 + 200, 200)  # Cerdo elevado
+    LevelData(
+        pigs=[
+            (X, 100),
+            (X + 200, 100),
+            (X + 400, 100),
+            (X + 200, 200)  # Cerdo elevado
         ],
-        "columns": [
+        columns=[
             # Base
-            (WIDTH // 2, 50), (WIDTH // 2 + 200, 50), (WIDTH // 2 + 400, 50),
+            (X, 50), (X + 200, 50), (X + 400, 50),
             # Torre central
-            (WIDTH // 2 + 200, 130), (WIDTH // 2 + 200, 210),
+            (X + 200, 130), (X + 200, 210),
             # Protecciones laterales
-            (WIDTH // 2 - 50, 50), (WIDTH // 2 + 450, 50),
+            (X - 50, 50), (X + 450, 50),
             # Torres adicionales
-            (WIDTH // 2 + 150, 50), (WIDTH // 2 + 250, 50)
+            (X + 150, 50), (X + 250, 50)
         ],
-        "description": "Nivel final - Torre con cerdo elevado",
-        "max_birds": 6
-    }
+        description="Nivel final - Torre con cerdo elevado",
+        max_birds=6,
+    ),
 ]
 
-def get_level(level_index: int) -> dict:
+
+# ---------------------------------------------------------------------------
+# Paquetes de niveles en disco
+#
+# Dos variantes con el mismo contenido (registros LevelData + índice):
+#   - JSON (.json): una línea de cabecera con el índice de desplazamientos y
+#     luego un nivel JSON por línea.
+#   - Binario (.alp): cabecera "ALP2" + cantidad, tabla de (offset, largo) y
+#     registros empaquetados con struct (coordenadas en float64, así un
+#     paquete .alp y uno .json de los mismos niveles dan el mismo LevelData).
+#     Los paquetes "ALP1" (float32) se siguen pudiendo leer.
+# Abrir un paquete solo lee la cabecera y el índice; cada nivel se parsea
+# cuando se pide y queda en un caché LRU.
+# ---------------------------------------------------------------------------
+
+PACK_FORMAT = "angry-levelpack"
+PACK_VERSION = 1
+BINARY_MAGIC = b"ALP2"
+LEVEL_CACHE_SIZE = 32
+
+_BIN_HEADER = struct.Struct("<4sI")      # magic, cantidad de niveles
+_BIN_INDEX = struct.Struct("<QI")        # offset desde el inicio, largo
+_BIN_RECORD = struct.Struct("<HHII")     # max_birds, largo desc, cerdos, columnas
+_BIN_POINT = struct.Struct("<dd")         # x, y
+# formato de punto según la versión del paquete binario
+_BIN_POINTS = {BINARY_MAGIC: _BIN_POINT, b"ALP1": struct.Struct("<ff")}
+
+
+def level_to_dict(level: LevelData) -> dict:
+    """Nivel como dict serializable a JSON (también lo usan las grabaciones)."""
+    return asdict(level)
+
+
+def level_from_dict(raw: dict) -> LevelData:
+    return LevelData(
+        pigs=[tuple(p) for p in raw["pigs"]],
+        columns=[tuple(c) for c in raw["columns"]],
+        description=raw.get("description", ""),
+        max_birds=raw.get("max_birds", 3),
+    )
+
+
+def _level_to_json(level: LevelData) -> bytes:
+    return json.dumps(level_to_dict(level), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _level_from_json(data: bytes) -> LevelData:
+    return level_from_dict(json.loads(data))
+
+
+def _level_to_binary(level: LevelData) -> bytes:
+    description = level.description.encode("utf-8")
+    parts = [_BIN_RECORD.pack(level.max_birds, len(description), len(level.pigs), len(level.columns)),
+             description]
+    parts.extend(_BIN_POINT.pack(x, y) for x, y in level.pigs)
+    parts.extend(_BIN_POINT.pack(x, y) for x, y in level.columns)
+    return b"".join(parts)
+
+
+def _level_from_binary(data: bytes, point: struct.Struct = _BIN_POINT) -> LevelData:
+    max_birds, desc_len, num_pigs, num_columns = _BIN_RECORD.unpack_from(data, 0)
+    offset = _BIN_RECORD.size
+    description = data[offset:offset + desc_len].decode("utf-8")
+    offset += desc_len
+    points = list(point.iter_unpack(data[offset:offset + (num_pigs + num_columns) * point.size]))
+    return LevelData(
+        pigs=points[:num_pigs],
+        columns=points[num_pigs:],
+        description=description,
+        max_birds=max_birds,
+    )
+
+
+def save_level_pack(path: str, levels: List[LevelData]):
+    """Escribe un paquete; el formato se elige por extensión (.alp = binario)."""
+    if path.endswith(".alp"):
+        records = [_level_to_binary(level) for level in levels]
+        offset = _BIN_HEADER.size + _BIN_INDEX.size * len(records)
+        index = []
+        for record in records:
+            index.append(_BIN_INDEX.pack(offset, len(record)))
+            offset += len(record)
+        with open(path, "wb") as f:
+            f.write(_BIN_HEADER.pack(BINARY_MAGIC, len(records)))
+            f.writelines(index)
+            f.writelines(records)
+    else:
+        records = [_level_to_json(level) + b"\n" for level in levels]
+        offsets = []
+        offset = 0
+        for record in records:
+            offsets.append(offset)
+            offset += len(record)
+        header = {"format": PACK_FORMAT, "version": PACK_VERSION, "count": len(records), "offsets": offsets}
+        with open(path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.writelines(records)
+
+
+class LevelPack:
+    """Paquete de niveles en disco, parseados a demanda con caché LRU."""
+
+    def __init__(self, path: str, cache_size: int = LEVEL_CACHE_SIZE):
+        self.path = path
+        self.binary = path.endswith(".alp")
+        self._file = open(path, "rb")
+        if self.binary:
+            magic, count = _BIN_HEADER.unpack(self._file.read(_BIN_HEADER.size))
+            if magic not in _BIN_POINTS:
+                raise ValueError(f"{path} no es un paquete de niveles binario")
+            self._point = _BIN_POINTS[magic]
+            table = self._file.read(_BIN_INDEX.size * count)
+            self._index = list(_BIN_INDEX.iter_unpack(table))
+        else:
+            header = json.loads(self._file.readline())
+            if header.get("format") != PACK_FORMAT or header.get("version") != PACK_VERSION:
+                raise ValueError(f"{path} no es un paquete de niveles JSON compatible")
+            data_start = self._file.tell()
+            self._index = [(data_start + offset, None) for offset in header["offsets"]]
+        self.get = lru_cache(maxsize=cache_size)(self._load)
+
+    def _load(self, index: int) -> LevelData:
+        offset, length = self._index[index]
+        self._file.seek(offset)
+        if self.binary:
+            return _level_from_binary(self._file.read(length), self._point)
+        return _level_from_json(self._file.readline())
+
+    def __len__(self):
+        return len(self._index)
+
+    def close(self):
+        self._file.close()
+
+
+_active_pack: Optional[LevelPack] = None
+
+
+def use_level_pack(path: Optional[str]) -> Optional[LevelPack]:
+    """Hace que get_level lea de un paquete en disco (None vuelve a LEVELS)."""
+    global _active_pack
+    if _active_pack is not None:
+        _active_pack.close()
+    _active_pack = LevelPack(path) if path else None
+    return _active_pack
+
+
+def get_level(level_index: int) -> LevelData:
     """Obtiene un nivel específico o el último si el índice es muy alto"""
-    if level_index < len(LEVELS):
-        return LEVELS[level_index]
-    return LEVELS[-1]  # Retorna el último nivel si se pasa del límite
+    total = get_total_levels()
+    if level_index >= total:
+        level_index = total - 1  # Retorna el último nivel si se pasa del límite
+    if _active_pack is not None:
+        return _active_pack.get(level_index)
+    return LEVELS[level_index]
+
 
 def get_total_levels() -> int:
     """Retorna el número total de niveles"""
+    if _active_pack is not None:
+        return len(_active_pack)
     return len(LEVELS)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exporta los niveles incluidos a un paquete")
+    parser.add_argument("path", help="destino (.json o .alp para binario)")
+    args = parser.parse_args()
+    save_level_pack(args.path, LEVELS)
+    print(f"{len(LEVELS)} niveles guardados en {args.path} ({os.path.getsize(args.path)} bytes)")
@@ -0,0 +1,295 @@
+"""
+Predicción física de la trayectoria.
+
+En vez de la parábola analítica, `TrajectoryPredictor` mantiene una copia
+persistente del espacio (`SpaceMirror`), la sincroniza en bloque, agrega el
+pájaro que se lanzaría (con su masa, `max_impulse` y `power_multiplier`
+reales) y lo simula en un hilo aparte. El resultado (camino y primer
+contacto) se recoge con `poll()` desde la vista, que nunca espera al hilo.
+Si el mouse se mueve antes de terminar, la petición vieja se descarta.
+"""
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+import numpy as np
+import pymunk
+from game_logic import ImpulseVector
+from game_object import BIRD_FILTER, BIRD_MASS, BIRD_RADIUS, launch_velocity
+
+try:
+    from pymunk.batch import Buffer, BodyFields, get_space_bodies, set_space_bodies
+except ImportError:  # pymunk < 6.6 no trae la API batch
+    Buffer = None
+
+if Buffer is not None:
+    BODY_ID = BodyFields.BODY_ID
+    STATE_FIELDS = (BodyFields.POSITION | BodyFields.ANGLE
+                    | BodyFields.VELOCITY | BodyFields.ANGULAR_VELOCITY)
+
+logger = logging.getLogger(__name__)
+
+PREDICTION_SECONDS = 2.0
+PREDICTION_COLLISION_TYPE = 99  # solo el pájaro simulado usa este tipo
+
+
+@dataclass
+class Prediction:
+    generation: int
+    points: List[Tuple[float, float]] = field(default_factory=list)
+    contact: Optional[Tuple[float, float]] = None
+
+
+def _copy_body(body: pymunk.Body) -> pymunk.Body:
+    if body.body_type == pymunk.Body.DYNAMIC:
+        copy = pymunk.Body(body.mass, body.moment)
+    else:
+        copy = pymunk.Body(body_type=body.body_type)
+    copy.position = body.position
+    copy.angle = body.angle
+    copy.velocity = body.velocity
+    copy.angular_velocity = body.angular_velocity
+    return copy
+
+
+def _copy_shape(shape: pymunk.Shape, body: pymunk.Body) -> Optional[pymunk.Shape]:
+    if isinstance(shape, pymunk.Circle):
+        copy = pymunk.Circle(body, shape.radius, shape.offset)
+    elif isinstance(shape, pymunk.Segment):
+        copy = pymunk.Segment(body, shape.a, shape.b, shape.radius)
+    elif isinstance(shape, pymunk.Poly):
+        copy = pymunk.Poly(body, shape.get_vertices(), radius=shape.radius)
+    else:
+        return None
+    copy.friction = shape.friction
+    copy.elasticity = shape.elasticity
+    copy.sensor = shape.sensor
+    copy.filter = shape.filter
+    copy.collision_type = shape.collision_type
+    return copy
+
+
+class SpaceMirror:
+    """
+    Copia persistente de un espacio, sin callbacks ni funciones de velocidad.
+
+    `sync` no reconstruye nada: solo copia las shapes que aparecieron, saca
+    las que desaparecieron y copia posición, ángulo y velocidades de todos
+    los cuerpos con una lectura y una escritura en bloque (`pymunk.batch`).
+    Después de simular en la copia, el próximo `sync` la deja otra vez igual
+    al original. Debe llamarse desde el hilo que simula el espacio original
+    y nunca mientras otro hilo simula la copia.
+    """
+
+    def __init__(self, space: pymunk.Space):
+        self.space = pymunk.Space()
+        self.space.gravity = space.gravity
+        self.space.iterations = space.iterations
+        self.space.damping = space.damping
+        self._bodies = {space.static_body: self.space.static_body}  # original -> copia
+        self._shapes = {}
+        self._static = {}       # cuerpos no dinámicos: la catapulta les cambia el tipo
+        self._ids = None        # ids de las copias ordenados, y el id original de cada una
+        self._source_ids = None
+        self._read = Buffer() if Buffer is not None else None
+        self._order = Buffer() if Buffer is not None else None
+        self._write = Buffer() if Buffer is not None else None
+        self.sync(space)
+
+    def _add_body(self, body):
+        copy = _copy_body(body)
+        self._bodies[body] = copy
+        if body.body_type != pymunk.Body.DYNAMIC:
+            self._static[body] = body.body_type
+        self.space.add(copy)
+        return copy
+
+    def _remove_body(self, body):
+        copy = self._bodies.pop(body)
+        self._static.pop(body, None)
+        self.space.remove(copy)
+
+    def _sync_structure(self, space):
+        # un cuerpo que la catapulta pasó de STATIC a DYNAMIC se vuelve a copiar
+        retyped = [body for body, body_type in self._static.items()
+                   if body.body_type != body_type and body is not space.static_body]
+        for body in retyped:
+            for shape in [s for s in self._shapes if s.body is body]:
+                self.space.remove(self._shapes.pop(shape))
+            self._remove_body(body)
+
+        shapes = set(space.shapes)
+        if shapes == self._shapes.keys() and not retyped:
+            return False
+        for shape in [s for s in self._shapes if s not in shapes]:
+            self.space.remove(self._shapes.pop(shape))
+        for body in [b for b in self._bodies if b.space is not space and b is not space.static_body]:
+            self._remove_body(body)
+        for shape in shapes:
+            if shape in self._shapes:
+                continue
+            body = self._bodies.get(shape.body)
+            if body is None:
+                body = self._add_body(shape.body)
+            copy = _copy_shape(shape, body)
+            if copy is not None:
+                self.space.add(copy)
+                self._shapes[shape] = copy
+        return True
+
+    def _sync_state(self, space):
+        if self._read is None:  # pymunk sin API batch: copia cuerpo por cuerpo
+            for body, copy in self._bodies.items():
+                if body is not space.static_body:
+                    copy.position, copy.angle = body.position, body.angle
+                    copy.velocity, copy.angular_velocity = body.velocity, body.angular_velocity
+            return
+        self._read.clear()
+        get_space_bodies(space, BODY_ID | STATE_FIELDS, self._read)
+        ids = np.frombuffer(self._read.int_buf(), dtype=np.uintp)
+        data = np.frombuffer(self._read.float_buf(), dtype=np.float64).reshape(-1, 6)
+        # orden en que la copia recorre sus cuerpos (el mismo que usa set_space_bodies)
+        self._order.clear()
+        get_space_bodies(self.space, BODY_ID, self._order)
+        order = np.frombuffer(self._order.int_buf(), dtype=np.uintp)
+        source = self._source_ids[np.searchsorted(self._ids, order)]
+        by_id = np.argsort(ids)
+        rows = by_id[np.searchsorted(ids[by_id], source)]
+        self._state = np.ascontiguousarray(data[rows])
+        self._write.set_float_buf(self._state)
+        set_space_bodies(self.space, STATE_FIELDS, self._write)
+
+    def sync(self, space: pymunk.Space):
+        if self._sync_structure(space) or self._ids is None:
+            pairs = [(copy.id, body.id) for body, copy in self._bodies.items()
+                     if body is not space.static_body]
+            pairs.sort()
+            self._ids = np.array([c for c, _ in pairs], dtype=np.uintp)
+            self._source_ids = np.array([o for _, o in pairs], dtype=np.uintp)
+        self._sync_state(space)
+
+
+def clone_space(space: pymunk.Space) -> pymunk.Space:
+    """
+    Copia bodies y shapes de `space` a un espacio nuevo, sin callbacks ni
+    funciones de velocidad. Debe llamarse desde el hilo que simula `space`.
+    """
+    return SpaceMirror(space).space
+
+
+def simulate_shot(space: pymunk.Space, impulse_vector: ImpulseVector, x: float, y: float,
+                  dt: float, seconds: float = PREDICTION_SECONDS,
+                  is_stale=lambda: False) -> Tuple[List[Tuple[float, float]], Optional[Tuple[float, float]]]:
+    """
+    Agrega un pájaro a `space` (una copia) y lo simula hasta su primer
+    contacto o hasta `seconds`; al terminar lo saca, así la copia se puede
+    volver a sincronizar. Retorna el camino y el punto de contacto.
+    """
+    body = pymunk.Body(BIRD_MASS, pymunk.moment_for_circle(BIRD_MASS, 0, BIRD_RADIUS))
+    body.position = (x, y)
+    body.velocity = launch_velocity(impulse_vector)
+    shape = pymunk.Circle(body, BIRD_RADIUS)
+    shape.collision_type = PREDICTION_COLLISION_TYPE
+    shape.filter = BIRD_FILTER
+    space.add(body, shape)
+
+    contact = []
+
+    def first_contact(arbiter, space, data):
+        if not contact:
+            points = arbiter.contact_point_set.points
+            contact.append(tuple(points[0].point_a) if points else tuple(body.position))
+        return True
+
+    handler = space.add_wildcard_collision_handler(PREDICTION_COLLISION_TYPE)
+    handler.begin = first_contact
+
+    points = [(body.position.x, body.position.y)]
+    try:
+        for _ in range(int(seconds / dt)):
+            if contact or is_stale():
+                break
+            space.step(dt)
+            points.append((body.position.x, body.position.y))
+    finally:
+        space.remove(body, shape)
+    return points, (contact[0] if contact else None)
+
+
+class TrajectoryPredictor:
+
+    def __init__(self, dt: float, seconds: float = PREDICTION_SECONDS):
+        self.dt = dt
+        self.seconds = seconds
+        self._generation = 0
+        self._pending = None
+        self._result = None
+        self._busy = False       # el hilo tiene (o va a tomar) la copia del espacio
+        self._mirror = None
+        self._source = None
+        self._condition = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="trajectory-predictor", daemon=True)
+        self._thread.start()
+
+    def request(self, space: pymunk.Space, impulse_vector: ImpulseVector, x: float, y: float) -> bool:
+        """
+        Sincroniza la copia del espacio y encola una predicción. Si el hilo
+        todavía simula una petición anterior, la marca como vieja para que
+        corte y retorna False: la vista debe volver a pedir en otro cuadro.
+        """
+        with self._condition:
+            if self._busy:
+                self._generation += 1
+                return False
+        # el hilo está libre: la copia es nuestra hasta encolar
+        if self._mirror is None or self._source is not space:
+            self._mirror = SpaceMirror(space)
+            self._source = space
+        else:
+            self._mirror.sync(space)
+        with self._condition:
+            self._generation += 1
+            self._pending = (self._generation, self._mirror.space, impulse_vector, x, y)
+            self._busy = True
+            self._condition.notify()
+        return True
+
+    def poll(self) -> Optional[Prediction]:
+        """Retorna la última predicción vigente una sola vez, o None."""
+        with self._condition:
+            result, self._result = self._result, None
+        return result
+
+    def cancel(self):
+        with self._condition:
+            self._generation += 1
+            if self._pending is not None:
+                self._pending = None
+                self._busy = False
+            self._result = None
+
+    def close(self):
+        with self._condition:
+            self._running = False
+            self._pending = None
+            self._condition.notify()
+
+    def _is_stale(self, generation):
+        return generation != self._generation
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running and self._pending is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                generation, space, impulse_vector, x, y = self._pending
+                self._pending = None
+            points, contact = simulate_shot(space, impulse_vector, x, y, self.dt, self.seconds,
+                                            is_stale=lambda: self._is_stale(generation))
+            with self._condition:
+                self._busy = False
+                if not self._is_stale(generation):
+                    self._result = Prediction(generation, points, contact)
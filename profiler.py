@@ -0,0 +1,176 @@
+"""
+Perfilador de fases por cuadro.
+
+`FrameProfiler` mide cuánto tarda cada fase de un cuadro (paso de física,
+sincronización de sprites, cercanía pájaro-cerdo, `check_bird_status`,
+`check_level_win`, fondo, sprites y HUD), guarda una ventana móvil de
+muestras con percentiles p50/p95/p99 y las exporta a JSON. Con F3 se muestra
+un overlay con la tabla y el gráfico de tiempo por cuadro.
+"""
+import json
+import logging
+import time
+from collections import deque
+import arcade
+from pyglet.graphics import Batch
+
+logger = logging.getLogger(__name__)
+
+PHASES = (
+    "physics", "sprites_update", "proximity", "check_bird_status", "check_level_win",
+    "draw_background", "draw_sprites", "draw_hud",
+)
+WINDOW_FRAMES = 600
+MAX_SAMPLES = 36000  # ~10 minutos a 60 Hz para el JSON exportado
+PROFILE_PATH = "profile_samples.json"
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + time.perf_counter() - self.start
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+class NullProfiler:
+    """Perfilador que no mide nada; es el que usa `World` por defecto."""
+    enabled = False
+    _phase = _NullPhase()
+
+    def phase(self, name):
+        return self._phase
+
+    def end_frame(self):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class FrameProfiler:
+
+    def __init__(self, window=WINDOW_FRAMES, max_samples=MAX_SAMPLES):
+        self.enabled = False
+        self.current = {}
+        self.frames = deque(maxlen=window)       # ventana para percentiles y gráfico
+        self.samples = deque(maxlen=max_samples)  # todo lo que se exporta
+        self._phases = {}
+        self._null_phase = _NullPhase()
+        self._last_frame = None
+
+    def phase(self, name):
+        if not self.enabled:
+            return self._null_phase
+        phase = self._phases.get(name)
+        if phase is None:
+            phase = self._phases[name] = _Phase(self, name)
+        return phase
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.current = {}
+        self._last_frame = None
+        logger.debug(f"Perfilador: {self.enabled}")
+
+    def end_frame(self):
+        """Cierra el cuadro actual; el tiempo total se mide entre llamadas."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            sample = {name: seconds * 1000 for name, seconds in self.current.items()}
+            sample["frame"] = (now - self._last_frame) * 1000
+            self.frames.append(sample)
+            self.samples.append(sample)
+        self._last_frame = now
+        self.current = {}
+
+    def percentiles(self, name, frames=None):
+        values = sorted(sample.get(name, 0.0) for sample in (frames or self.frames))
+        if not values:
+            return 0.0, 0.0, 0.0
+        last = len(values) - 1
+        return tuple(values[min(last, int(len(values) * q))] for q in (0.50, 0.95, 0.99))
+
+    def dump(self, path=PROFILE_PATH):
+        if not self.samples:
+            return False
+        summary = {}
+        for name in PHASES + ("frame",):
+            p50, p95, p99 = self.percentiles(name, self.samples)
+            summary[name] = {"p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+        with open(path, "w") as f:
+            json.dump({"summary": summary, "samples": list(self.samples)}, f)
+        logger.info(f"{len(self.samples)} cuadros de perfil guardados en {path}")
+        return True
+
+
+# perfilador compartido por todas las vistas del juego
+FRAME_PROFILER = FrameProfiler()
+
+
+class ProfilerOverlay:
+    """Tabla de percentiles y gráfico de tiempo por cuadro."""
+
+    REFRESH_FRAMES = 30  # la tabla se recalcula cada medio segundo
+
+    def __init__(self, profiler, x=10, y=480, graph_width=300, graph_height=80):
+        self.profiler = profiler
+        self.x = x
+        self.y = y
+        self.graph_width = graph_width
+        self.graph_height = graph_height
+        self.batch = Batch()
+        self.lines = []
+        for i, name in enumerate(("fase",) + PHASES + ("frame",)):
+            self.lines.append(arcade.Text("", x, y - i * 18, arcade.color.WHITE, 12,
+                                          font_name="Courier New", batch=self.batch))
+        self._frames_since_refresh = self.REFRESH_FRAMES
+
+    def _refresh(self):
+        self.lines[0].text = f"{'fase':<18}{'p50':>7}{'p95':>7}{'p99':>7} ms"
+        for line, name in zip(self.lines[1:], PHASES + ("frame",)):
+            p50, p95, p99 = self.profiler.percentiles(name)
+            line.text = f"{name:<18}{p50:>7.2f}{p95:>7.2f}{p99:>7.2f}"
+
+    def draw(self):
+        self._frames_since_refresh += 1
+        if self._frames_since_refresh >= self.REFRESH_FRAMES:
+            self._frames_since_refresh = 0
+            self._refresh()
+        top = self.y + 20
+        bottom = self.y - len(self.lines) * 18 - self.graph_height - 10
+        arcade.draw_lrbt_rectangle_filled(self.x - 5, self.x + self.graph_width + 5, bottom, top,
+                                          (0, 0, 0, 170))
+        self.batch.draw()
+
+        # gráfico: 33 ms (30 FPS) llena la altura; la línea guía marca 16.7 ms
+        frames = self.profiler.frames
+        if len(frames) > 1:
+            base = bottom + 5
+            scale = self.graph_height / 33.3
+            step = self.graph_width / (frames.maxlen - 1)
+            points = [(self.x + i * step, base + min(sample["frame"], 33.3) * scale)
+                      for i, sample in enumerate(frames)]
+            arcade.draw_line_strip(points, arcade.color.LIME_GREEN, 1)
+            target = base + 16.7 * scale
+            arcade.draw_line(self.x, target, self.x + self.graph_width, target, arcade.color.RED, 1)
@@ -0,0 +1,72 @@
+"""
+Índice de los objetos del mundo.
+
+Relaciona cada shape y body de pymunk con el sprite que lo dibuja y mantiene
+colecciones por tipo (cerdos, pájaros, columnas). Así los callbacks de
+colisión resuelven su objeto en O(1) y el trabajo por cuadro no recorre
+todos los objetos del nivel.
+"""
+from game_object import Bird, Column, Pig
+
+
+class ObjectRegistry:
+
+    def __init__(self):
+        self.by_shape = {}
+        self.by_body = {}
+        # dicts usados como conjuntos ordenados: remover es O(1) y el orden
+        # de iteración no depende de id(), así la simulación es repetible
+        self.pigs = {}
+        self.birds = {}
+        self.columns = {}
+        # cambia con cada alta o baja; SpriteSync lo usa para reindexar
+        self.version = 0
+
+    def _collection_for(self, obj):
+        if isinstance(obj, Pig):
+            return self.pigs
+        if isinstance(obj, Bird):
+            return self.birds
+        if isinstance(obj, Column):
+            return self.columns
+        return None
+
+    def add(self, obj):
+        self.by_shape[obj.shape] = obj
+        self.by_body[obj.body] = obj
+        self.version += 1
+        collection = self._collection_for(obj)
+        if collection is not None:
+            collection[obj] = None
+
+    def remove(self, obj):
+        """Quita el objeto del índice. Retorna False si ya no estaba registrado."""
+        if self.by_shape.pop(obj.shape, None) is None:
+            return False
+        self.by_body.pop(obj.body, None)
+        self.version += 1
+        collection = self._collection_for(obj)
+        if collection is not None:
+            collection.pop(obj, None)
+        return True
+
+    def get(self, shape):
+        return self.by_shape.get(shape)
+
+    def get_pig(self, shape):
+        obj = self.by_shape.get(shape)
+        return obj if obj in self.pigs else None
+
+    def clear(self):
+        self.by_shape.clear()
+        self.by_body.clear()
+        self.pigs.clear()
+        self.birds.clear()
+        self.columns.clear()
+        self.version += 1
+
+    def __contains__(self, obj):
+        return obj.shape in self.by_shape and self.by_shape[obj.shape] is obj
+
+    def __len__(self):
+        return len(self.by_shape)
@@ -0,0 +1,126 @@
+"""
+Grabación y reproducción determinista de partidas.
+
+`InputRecorder` guarda cada evento que recibe `GameView` junto con el número
+de paso fijo de la simulación en el que llegó (`World.total_steps`). `replay`
+vuelve a aplicar esos eventos sobre un `World` nuevo, en los mismos pasos,
+con el mismo nivel (la grabación guarda el `LevelData` completo, así que no
+depende de qué paquete de niveles esté activo al reproducir),
+sin ventana y tan rápido como da la CPU. Como la física avanza con paso fijo
+y los eventos se aplican entre pasos, la misma grabación da el mismo puntaje,
+las mismas estrellas y las mismas posiciones.
+
+    python replay.py grabacion.json --verify
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+from controller import InputController
+from levels import level_from_dict, level_to_dict
+from world import World
+
+logger = logging.getLogger(__name__)
+
+RECORDING_VERSION = 2  # la versión 1 guardaba solo el índice del nivel
+
+
+def world_state(world):
+    """Estado final comparable entre una partida y su reproducción."""
+    return {
+        "score": world.score,
+        "stars": world.check_level_win(),
+        "pigs_left": world.pigs_left,
+        "birds_launched": world.birds_launched,
+        "bodies": [[body.position.x, body.position.y, body.angle] for body in world.space.bodies],
+    }
+
+
+class InputRecorder:
+
+    def __init__(self, world):
+        self.world = world
+        self.level_idx = world.level_idx
+        self.level = world.level
+        self.events = []
+
+    def record(self, kind, *args):
+        self.events.append([self.world.total_steps, kind, *args])
+
+    def to_dict(self):
+        return {
+            "version": RECORDING_VERSION,
+            "level": self.level_idx,
+            "level_data": level_to_dict(self.level),
+            "physics_hz": round(1.0 / self.world.physics_dt),
+            "total_steps": self.world.total_steps,
+            "events": self.events,
+            "final": world_state(self.world),
+        }
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+        logger.info(f"Grabación de {len(self.events)} eventos guardada en {path}")
+
+
+def apply_event(controller, kind, args):
+    # mouse_press, mouse_drag, mouse_release y key_press
+    getattr(controller, "on_" + kind)(*args)
+
+
+def replay(recording):
+    """Reproduce una grabación sin ventana y retorna el `World` resultante."""
+    version = recording.get("version")
+    if version == RECORDING_VERSION:
+        world = World(0, physics_hz=recording["physics_hz"],
+                      levels=[level_from_dict(recording["level_data"])])
+    elif version == 1:
+        # solo el índice: reproduce bien únicamente con los niveles de entonces
+        world = World(recording["level"], physics_hz=recording["physics_hz"])
+    else:
+        raise ValueError(f"Versión de grabación no soportada: {version}")
+    controller = InputController(world)
+    events = recording["events"]
+    total_steps = recording["total_steps"]
+    dt = world.physics_dt
+    i = 0
+    while True:
+        while i < len(events) and events[i][0] <= world.total_steps:
+            _, kind, *args = events[i]
+            apply_event(controller, kind, args)
+            i += 1
+        if world.total_steps >= total_steps:
+            break
+        world.tick(dt)
+    return world
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reproduce una partida grabada sin ventana")
+    parser.add_argument("recording", help="archivo JSON grabado con F5")
+    parser.add_argument("--verify", action="store_true", help="compara con el estado final grabado")
+    parser.add_argument("--repeat", type=int, default=1, help="reproducciones (para medir rendimiento)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    with open(args.recording) as f:
+        recording = json.load(f)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        world = replay(recording)
+    elapsed = time.perf_counter() - start
+    state = world_state(world)
+    steps = recording["total_steps"] * args.repeat
+    print(f"puntaje={state['score']} estrellas={state['stars']} cerdos={state['pigs_left']} "
+          f"pasos={recording['total_steps']} ({steps / elapsed:.0f} pasos/s)")
+    if args.verify:
+        if state != recording["final"]:
+            print("La reproducción NO coincide con la partida grabada")
+            sys.exit(1)
+        print("La reproducción coincide con la partida grabada")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+Buscador de disparos óptimos por nivel.
+
+Barre ángulo, impulso y tipo de pájaro, simula cada candidato con `World`
+(sin ventana) en un pool de procesos y reporta la secuencia más corta que
+gana el nivel con 3 estrellas según `World.compute_stars`. La búsqueda es
+por haz: en cada profundidad se prueba una grilla gruesa sobre los mejores
+prefijos y solo se refinan las celdas que mataron algún cerdo. Si ningún
+disparo de una profundidad mata un cerdo nuevo, la búsqueda sigue con los
+prefijos que más movieron el nivel (un primer disparo que derriba una torre
+puede ser lo que habilita el segundo).
+
+La grilla es un muestreo, así que el reporte distingue tres resultados:
+"won" (se encontró una secuencia ganadora), "inconclusive" (no se encontró
+con esta grilla; una más fina puede encontrarla) y "unwinnable" (ningún
+disparo de la grilla toca siquiera el nivel).
+
+    python solver.py --levels 0 1 --workers 8 --json solucion.json
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import List, Optional, Tuple
+from levels import get_level, get_total_levels, use_level_pack
+from world import World
+
+logger = logging.getLogger(__name__)
+
+SETTLE_SECONDS = 1.0     # espera antes del primer disparo, como haría un jugador
+MAX_SHOT_SECONDS = 8.0   # tope por disparo si el pájaro nunca se detiene
+ABILITY_DELAY = 0.3      # segundos tras el lanzamiento para usar SPACE
+BIRD_TYPES = ("red", "yellow", "blue")
+MOVED_EPSILON = 1.0      # px; por debajo se considera que el disparo no tocó el nivel
+
+WON = "won"
+INCONCLUSIVE = "inconclusive"
+UNWINNABLE = "unwinnable"
+
+
+@dataclass(frozen=True)
+class Shot:
+    bird_type: str
+    angle: float              # ángulo de salida en radianes
+    impulse: float
+    ability_delay: Optional[float] = None
+
+
+@dataclass
+class ShotResult:
+    shots: Tuple[Shot, ...]
+    pigs_killed: int
+    score: int
+    stars: Optional[int]
+    moved: float = 0.0        # px que se desplazaron cerdos y columnas, en total
+
+
+def simulate_shots(level_idx: int, shots: Tuple[Shot, ...], levels=None) -> ShotResult:
+    """Juega `shots` en orden sobre un nivel recién cargado."""
+    world = World(level_idx, levels=levels)
+    dt = world.physics_dt
+    world.step(int(SETTLE_SECONDS / dt))
+    settled = {obj: tuple(obj.body.position)
+               for objects in (world.registry.pigs, world.registry.columns) for obj in objects}
+    max_steps = int(MAX_SHOT_SECONDS / dt)
+    for shot in shots:
+        if world.level_complete:
+            break
+        world.shoot(shot.bird_type, shot.angle, shot.impulse)
+        ability_step = None if shot.ability_delay is None else int(shot.ability_delay / dt)
+        for i in range(max_steps):
+            if i == ability_step:
+                world.use_ability()
+            world.tick(dt)
+            if world.can_launch or world.level_complete:
+                break
+    num_pigs = len(_level(level_idx, levels).pigs)
+    # un cerdo muerto ya cuenta en pigs_killed; acá solo importa lo que sigue en pie
+    moved = sum(math.dist(obj.body.position, position) for obj, position in settled.items()
+                if obj.body in world.registry.by_body)
+    return ShotResult(tuple(shots), num_pigs - world.pigs_left, world.score, world.check_level_win(), moved)
+
+
+def _level(level_idx, levels):
+    return get_level(level_idx) if levels is None else levels[level_idx]
+
+
+def _simulate_job(job):
+    return simulate_shots(*job)
+
+
+def shot_grid(angles, impulses, bird_types=BIRD_TYPES):
+    shots = []
+    for bird_type in bird_types:
+        delay = None if bird_type == "red" else ABILITY_DELAY
+        for angle in angles:
+            for impulse in impulses:
+                shots.append(Shot(bird_type, angle, impulse, delay))
+    return shots
+
+
+def linspace(low, high, count):
+    if count == 1:
+        return [(low + high) / 2]
+    return [low + (high - low) * i / (count - 1) for i in range(count)]
+
+
+class SerialExecutor:
+    """Sustituto de un pool que simula en el proceso actual (para usar
+    `ShotSolver` dentro de un worker, como hace `generator.py`)."""
+
+    def map(self, fn, *iterables, chunksize=1):
+        return map(fn, *iterables)
+
+
+class ShotSolver:
+
+    def __init__(self, executor, angle_range=(math.radians(-10), math.radians(75)),
+                 impulse_range=(20, 100), angle_steps=18, impulse_steps=9,
+                 bird_types=BIRD_TYPES, beam_width=4, levels=None):
+        self.executor = executor
+        self.levels = levels  # lista de LevelData propia; None usa get_level
+        self.angles = linspace(*angle_range, angle_steps)
+        self.impulses = linspace(*impulse_range, impulse_steps)
+        self.angle_step = (angle_range[1] - angle_range[0]) / max(angle_steps - 1, 1)
+        self.impulse_step = (impulse_range[1] - impulse_range[0]) / max(impulse_steps - 1, 1)
+        self.bird_types = bird_types
+        self.beam_width = beam_width
+        self.simulations = 0
+
+    def _evaluate(self, level_idx, sequences) -> List[ShotResult]:
+        self.simulations += len(sequences)
+        jobs = [(level_idx, seq, self.levels) for seq in sequences]
+        chunksize = max(1, len(jobs) // (8 * (os.cpu_count() or 1)))
+        return list(self.executor.map(_simulate_job, jobs, chunksize=chunksize))
+
+    def _refine(self, shot):
+        # subgrilla de 3x3 alrededor de una celda prometedora
+        shots = []
+        for da in (-0.5, 0, 0.5):
+            for di in (-0.5, 0, 0.5):
+                if da == 0 and di == 0:
+                    continue
+                shots.append(Shot(shot.bird_type, shot.angle + da * self.angle_step,
+                                  shot.impulse + di * self.impulse_step, shot.ability_delay))
+        return shots
+
+    def solve(self, level_idx: int, max_shots: Optional[int] = None) -> dict:
+        level = _level(level_idx, self.levels)
+        num_pigs = len(level.pigs)
+        max_shots = max_shots or level.max_birds
+        grid = shot_grid(self.angles, self.impulses, self.bird_types)
+        beam = [ShotResult((), 0, 0, None)]
+        best = beam[0]
+        result = INCONCLUSIVE
+        start = time.perf_counter()
+        for depth in range(1, max_shots + 1):
+            sequences = [prefix.shots + (shot,) for prefix in beam for shot in grid]
+            results = self._evaluate(level_idx, sequences)
+            kills_before = {prefix.shots: prefix.pigs_killed for prefix in beam}
+            # poda: solo se refinan las celdas que mataron algún cerdo nuevo
+            promising = [r for r in results if r.pigs_killed > kills_before[r.shots[:-1]]]
+            refined = [r.shots[:-1] + (shot,) for r in promising for shot in self._refine(r.shots[-1])]
+            if refined:
+                results += self._evaluate(level_idx, refined)
+            winners = [r for r in results if r.stars is not None]
+            if winners:
+                best = max(winners, key=lambda r: (r.stars, r.score))
+                result = WON
+                break
+            improving = [r for r in results if r.pigs_killed > kills_before[r.shots[:-1]]]
+            if improving:
+                improving.sort(key=lambda r: (r.pigs_killed, r.score, r.moved), reverse=True)
+                beam = improving[:self.beam_width]
+            else:
+                # nada mató un cerdo nuevo: seguir con los prefijos que más
+                # movieron el nivel en vez de abandonar la búsqueda
+                moving = [r for r in results if r.moved > MOVED_EPSILON]
+                if not moving:
+                    if depth == 1:
+                        result = UNWINNABLE
+                    break
+                moving.sort(key=lambda r: (r.pigs_killed, r.score, r.moved), reverse=True)
+                beam = moving[:self.beam_width]
+            if (beam[0].pigs_killed, beam[0].score) >= (best.pigs_killed, best.score):
+                best = beam[0]
+            logger.info(f"Nivel {level_idx + 1}: profundidad {depth}, mejor {best.pigs_killed}/{num_pigs} cerdos")
+        return {
+            "level": level_idx,
+            "description": level.description,
+            "pigs": num_pigs,
+            "max_birds": level.max_birds,
+            "result": result,
+            "won": result == WON,
+            "stars": best.stars,
+            "birds_used": len(best.shots),
+            "pigs_killed": best.pigs_killed,
+            "score": best.score,
+            "shots": [asdict(shot) for shot in best.shots],
+            "simulations": self.simulations,
+            "seconds": round(time.perf_counter() - start, 2),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Busca disparos que ganan cada nivel con 3 estrellas")
+    parser.add_argument("--levels", type=int, nargs="*", help="índices de nivel (por defecto todos)")
+    parser.add_argument("--workers", type=int, default=None, help="procesos del pool")
+    parser.add_argument("--angles", type=int, default=18, help="pasos de ángulo en la grilla gruesa")
+    parser.add_argument("--impulses", type=int, default=9, help="pasos de impulso en la grilla gruesa")
+    parser.add_argument("--beam", type=int, default=4, help="prefijos que sobreviven en cada profundidad")
+    parser.add_argument("--pack", help="paquete de niveles (.json o .alp) en lugar de LEVELS")
+    parser.add_argument("--json", help="archivo donde guardar el reporte")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    use_level_pack(args.pack)
+    levels = args.levels if args.levels else range(get_total_levels())
+    reports = []
+    # cada proceso del pool abre el mismo paquete (con su propio caché)
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=use_level_pack,
+                             initargs=(args.pack,)) as executor:
+        for level_idx in levels:
+            solver = ShotSolver(executor, angle_steps=args.angles,
+                                impulse_steps=args.impulses, beam_width=args.beam)
+            report = solver.solve(level_idx)
+            reports.append(report)
+            print(f"Nivel {level_idx + 1}: {report['result']} estrellas={report['stars']} "
+                  f"pájaros={report['birds_used']}/{report['max_birds']} "
+                  f"cerdos={report['pigs_killed']}/{report['pigs']} "
+                  f"({report['simulations']} simulaciones, {report['seconds']} s)")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(reports, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
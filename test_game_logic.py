@@ -0,0 +1,53 @@
+"""
+Las versiones por lotes de game_logic deben coincidir con las escalares:
+distancias e impulsos idénticos y ángulos dentro de BATCH_ANGLE_TOLERANCE.
+
+    python -m pytest test_game_logic.py
+"""
+import numpy as np
+import pytest
+from game_logic import (BATCH_ANGLE_TOLERANCE, Point2D, get_angle_radians, get_angle_radians_batch,
+                        get_distance, get_distance_batch, get_impulse_vector, get_impulse_vector_batch)
+
+PAIRS = 50_000
+COORDINATE_RANGE = 2000.0
+
+
+def random_points(rng, count):
+    return rng.uniform(-COORDINATE_RANGE, COORDINATE_RANGE, (count, 2))
+
+
+def scalar(fn, points_a, points_b):
+    return [fn(Point2D(*a), Point2D(*b)) for a, b in zip(points_a.tolist(), points_b.tolist())]
+
+
+def check(points_a, points_b, pairs_a, pairs_b):
+    """Compara las tres funciones; `pairs_*` son los puntos ya difundidos a (N, 2)."""
+    angles = np.array(scalar(get_angle_radians, pairs_a, pairs_b))
+    np.testing.assert_allclose(get_angle_radians_batch(points_a, points_b), angles,
+                               rtol=0, atol=BATCH_ANGLE_TOLERANCE)
+
+    distances = np.array(scalar(get_distance, pairs_a, pairs_b))
+    np.testing.assert_array_equal(get_distance_batch(points_a, points_b), distances)
+
+    vectors = scalar(get_impulse_vector, pairs_a, pairs_b)
+    batch_angles, batch_impulses = get_impulse_vector_batch(points_a, points_b)
+    np.testing.assert_allclose(batch_angles, [v.angle for v in vectors], rtol=0, atol=BATCH_ANGLE_TOLERANCE)
+    np.testing.assert_array_equal(batch_impulses, [v.impulse for v in vectors])
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_batch_matches_scalar(seed):
+    rng = np.random.default_rng(seed)
+    points_a, points_b = random_points(rng, PAIRS), random_points(rng, PAIRS)
+    check(points_a, points_b, points_a, points_b)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_batch_broadcasts_single_point(seed):
+    rng = np.random.default_rng(seed)
+    start, ends = random_points(rng, 1)[0], random_points(rng, PAIRS)
+    starts = np.broadcast_to(start, ends.shape)
+    # un solo punto de cada lado: contra N puntos finales y contra N iniciales
+    check(start, ends, starts, ends)
+    check(ends, start, ends, starts)
@@ -0,0 +1,80 @@
+"""
+Reiniciar un nivel no debe dejar bodies ni shapes en el espacio ni hacer más
+lento el paso de física, aunque cada intento lance un pájaro y dibuje una
+rampa con la catapulta.
+
+El tiempo de paso se mide en un nivel sintético con los cuerpos despiertos:
+en los niveles del juego todo se duerme al asentarse y un paso cuesta
+microsegundos, así que una fuga no se notaría en el tiempo.
+
+    python -m pytest test_world.py
+"""
+import math
+import statistics
+import time
+import pytest
+from benchmark import synthetic_level
+from levels import get_total_levels
+from world import World
+
+RESTARTS = 100
+TIMED_STEPS = 60
+SETTLE_STEPS = 60
+TIMED_COLUMNS = 200  # ~0.25 ms por paso con todo despierto
+# el paso después de los reinicios puede ser a lo sumo este factor más lento
+STEP_TIME_FACTOR = 2.0
+
+
+def step_time(world):
+    """Mediana de `space.step` con todos los cuerpos despiertos."""
+    world.step(SETTLE_STEPS)
+    samples = []
+    for _ in range(TIMED_STEPS):
+        for body in world.space.bodies:
+            body.activate()
+        start = time.perf_counter()
+        world.space.step(world.physics_dt)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def play_attempt(world):
+    """Un intento: disparo con la resortera y una rampa de catapulta."""
+    world.shoot("blue", math.radians(30), 90)
+    world.step(10)
+    world.use_ability()
+    world.step(20)
+    catapult = world.catapult
+    catapult.start_counterweight_draw(400, 300)
+    for i in range(1, 20):
+        catapult.update_counterweight_draw(400 + i * 10, 300 - i * 5)
+    catapult.finish_counterweight_draw()
+    world.step(10)
+
+
+@pytest.mark.parametrize("level_idx", range(get_total_levels()))
+def test_restart_does_not_leak(level_idx):
+    world = World(level_idx)
+    bodies, shapes = len(world.space.bodies), len(world.space.shapes)
+
+    for _ in range(RESTARTS):
+        play_attempt(world)
+        world.restart_level()
+
+    assert len(world.space.bodies) == bodies
+    assert len(world.space.shapes) == shapes
+
+
+def test_restart_keeps_step_time():
+    world = World(0, levels=[synthetic_level(TIMED_COLUMNS)])
+    bodies, shapes = len(world.space.bodies), len(world.space.shapes)
+    baseline = step_time(world)
+    world.restart_level()
+
+    for _ in range(RESTARTS):
+        play_attempt(world)
+        world.restart_level()
+
+    assert len(world.space.bodies) == bodies
+    assert len(world.space.shapes) == shapes
+    assert step_time(world) <= baseline * STEP_TIME_FACTOR
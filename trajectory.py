@@ -0,0 +1,78 @@
+"""
+Vista previa de la trayectoria de la resortera.
+
+Los puntos de la parábola se recalculan solo cuando cambia el punto de
+arrastre, y se dibujan como una `SpriteList` de círculos: una sola llamada
+de dibujo sin importar cuántos puntos tenga la vista previa.
+"""
+import math
+import arcade
+from game_logic import Point2D, get_impulse_vector
+from world import GRAVITY
+
+PREVIEW_POINTS = 20
+PREVIEW_VELOCITY_FACTOR = 4  # Ajusta el factor para que la parábola sea visible
+PREVIEW_FRACTION = 0.25      # Solo 1/4 del trayecto
+
+
+class TrajectoryPreview:
+
+    def __init__(self, num_points=PREVIEW_POINTS, radius=6, color=arcade.color.AERO_BLUE):
+        self.num_points = num_points
+        self.points = []
+        self._key = None
+        self.sprites = arcade.SpriteList()
+        for _ in range(num_points):
+            self.sprites.append(arcade.SpriteCircle(radius, color))
+        # marcador del primer contacto (solo en la predicción física)
+        self.contact_sprite = arcade.SpriteCircle(radius + 4, arcade.color.RED)
+        self.contact_sprite.visible = False
+        self.sprites.append(self.contact_sprite)
+
+    def update(self, start_point: Point2D, end_point: Point2D) -> bool:
+        """Recalcula la parábola si el arrastre cambió. Retorna True si hubo cambios."""
+        key = (start_point.x, start_point.y, end_point.x, end_point.y)
+        if key == self._key:
+            return False
+        self._key = key
+        self._place(self.compute_points(start_point, end_point, self.num_points), None)
+        return True
+
+    def set_path(self, path, contact=None):
+        """Muestra un camino ya simulado, remuestreado a `num_points` puntos."""
+        self._key = None
+        if len(path) > self.num_points:
+            last = len(path) - 1
+            path = [path[round(i * last / (self.num_points - 1))] for i in range(self.num_points)]
+        self._place(path, contact)
+
+    def _place(self, points, contact):
+        self.points = points
+        for i in range(self.num_points):
+            sprite = self.sprites[i]
+            sprite.visible = i < len(points)
+            if sprite.visible:
+                sprite.position = points[i]
+        self.contact_sprite.visible = contact is not None
+        if contact is not None:
+            self.contact_sprite.position = contact
+
+    @staticmethod
+    def compute_points(start_point: Point2D, end_point: Point2D, num_points=PREVIEW_POINTS):
+        # Calcular vector de impulso (ángulo y fuerza)
+        impulse_vector = get_impulse_vector(start_point, end_point)
+        velocity = impulse_vector.impulse * PREVIEW_VELOCITY_FACTOR
+        g = abs(GRAVITY)
+        vx = velocity * math.cos(impulse_vector.angle)
+        vy = velocity * math.sin(impulse_vector.angle)
+        t_total = (2 * vy) / g if g != 0 else 1
+        dt = t_total * PREVIEW_FRACTION / max(num_points - 1, 1)
+        x0, y0 = start_point.x, start_point.y
+        half_g = 0.5 * g
+        return [
+            (x0 + vx * t, y0 + vy * t - half_g * t * t)
+            for t in (dt * i for i in range(num_points))
+        ]
+
+    def draw(self):
+        self.sprites.draw()
@@ -0,0 +1,426 @@
+"""
+Simulación del juego sin ventana.
+
+`World` es dueño del `pymunk.Space`, del piso y las paredes, de los objetos
+del nivel y de las reglas (puntaje, turnos, victoria). No carga texturas de
+la interfaz ni necesita un contexto OpenGL, así que se puede avanzar N pasos
+y alimentar con disparos desde scripts, benchmarks o CI. `GameView` solo lo
+dibuja y le traduce la entrada del usuario.
+"""
+import math
+import logging
+from typing import NamedTuple
+import arcade
+import pymunk
+from game_object import Bird, BlueBird, Column, Pig, YellowBird, WALL_FILTER
+from catapult import Catapult
+from bird_pool import BirdPool
+from game_logic import ImpulseVector, Point2D, get_impulse_vector
+from levels import get_level
+from registry import ObjectRegistry
+from body_sync import SpriteSync
+from profiler import NULL_PROFILER
+
+logger = logging.getLogger(__name__)
+
+WIDTH = 1550
+HEIGHT = 900
+GRAVITY = -900
+FLOOR_Y = 15
+PHYSICS_HZ = 60
+MAX_STEPS_PER_FRAME = 5  # tope de pasos de recuperación por cuadro
+SLEEP_TIME_THRESHOLD = 0.5  # segundos quieto antes de que pymunk duerma un cuerpo
+IDLE_SPEED_THRESHOLD = 10.0  # px/s; más bajo y un pájaro rodando por el piso nunca se duerme
+WALL_HEIGHT = 4 * HEIGHT  # alto de las paredes: un cerdo despedido no las salta
+WALL_RADIUS = 100
+PIG_KILL_DISTANCE = 1.0  # un pájaro a esta distancia del centro mata al cerdo
+# Lo que sale de estos límites se retira enseguida (ver cull_out_of_bounds).
+# Arriba no hay tope: un pájaro que sube fuera de la pantalla vuelve a caer.
+WORLD_BOUNDS = pymunk.BB(left=-100, bottom=-100, right=WIDTH + 100, top=math.inf)
+SLING_START = (175, 127)  # punto desde el que se mide el arrastre de la resortera
+
+
+BIRD_PIG = "bird_pig"
+
+
+class CollisionEvent(NamedTuple):
+    """Choque anotado durante `space.step` y aplicado después del paso."""
+    kind: str
+    a: object          # pájaro
+    b: object          # cerdo
+    impulse: float     # estimado al primer contacto (0 para la regla de cercanía)
+    x: float
+    y: float
+
+
+class World:
+
+    def __init__(self, level_idx=0, physics_hz=PHYSICS_HZ, max_steps_per_frame=MAX_STEPS_PER_FRAME,
+                 levels=None, bounds=WORLD_BOUNDS):
+        self.levels = levels  # lista de LevelData propia; None usa get_level (LEVELS o el paquete activo)
+        self.bounds = bounds
+        self.space = pymunk.Space()
+        self.space.gravity = (0, GRAVITY)
+        # Los cuerpos quietos (y sus grupos de contacto) se duermen: el solver
+        # los salta y su sprite no se vuelve a sincronizar hasta que despierten
+        self.space.sleep_time_threshold = SLEEP_TIME_THRESHOLD
+        self.space.idle_speed_threshold = IDLE_SPEED_THRESHOLD
+        # Handler específico: pájaro (1) toca cerdo (2)
+        self.bird_pig_handler = self.space.add_collision_handler(1, 2)
+        self.bird_pig_handler.begin = self.bird_hits_pig
+        self.collision_events = []  # choques del paso en curso
+
+        # Puntaje y efectos flotantes
+        self.score = 0
+        self.floating_scores = []  # lista de dicts: {x, y, value, timer}
+
+        # Paredes invisibles solo para cerdos: el filtro hace que el resto de
+        # los objetos las atraviese sin que el paso salga de C
+        # los cerdos quedan entre x=0 y x=WIDTH-40; las paredes son gruesas para
+        # que un cerdo despedido a toda velocidad no las atraviese en un paso
+        r = WALL_RADIUS
+        self.left_wall = pymunk.Segment(self.space.static_body, (-r, 0), (-r, WALL_HEIGHT), r)
+        self.right_wall = pymunk.Segment(self.space.static_body, (WIDTH - 40 + r, 0),
+                                         (WIDTH - 40 + r, WALL_HEIGHT), r)
+        for wall in (self.left_wall, self.right_wall):
+            wall.filter = WALL_FILTER
+            wall.elasticity = 0  # el cerdo se frena contra la pared en vez de rebotar
+        self.space.add(self.left_wall, self.right_wall)
+
+        floor_body = pymunk.Body(body_type=pymunk.Body.STATIC)
+        floor_shape = pymunk.Segment(floor_body, [0, FLOOR_Y], [WIDTH, FLOOR_Y], 0.0)
+        floor_shape.friction = 10
+        self.space.add(floor_body, floor_shape)
+
+        # Paso fijo de física: el acumulador guarda el tiempo real pendiente
+        self.physics_dt = 1.0 / physics_hz
+        self.max_steps_per_frame = max_steps_per_frame
+        self.accumulator = 0.0
+        self.frame_steps = 0      # pasos de física ejecutados en el último cuadro
+        self.dropped_steps = 0    # pasos descartados por el tope desde el inicio
+        self.total_steps = 0
+        self.profiler = NULL_PROFILER  # GameView lo cambia por el perfilador de cuadros
+
+        self.level_idx = level_idx
+        self.sprites = arcade.SpriteList()
+        self.registry = ObjectRegistry()
+        self.bird_pool = BirdPool(self.space)
+        # se llama una sola vez con las estrellas cuando muere el último cerdo
+        self.on_level_complete = None
+
+        # sistema de catapulta (antes de cargar el nivel: clear_level la reinicia)
+        self.catapult_mode = False
+        self.catapult = Catapult(200, 100, self.space)
+        self.catapult_bird_ready = False
+
+        self.load_level(self.level_idx)
+
+        # variables de turnos
+        self.current_bird = None
+        self.can_launch = True
+
+    def load_level(self, idx):
+        self.clear_level()
+        self.sprites = arcade.SpriteList()
+        self.registry = ObjectRegistry()
+        self.sprite_sync = SpriteSync(self.registry)
+        self.collision_events = []
+        level = get_level(idx) if self.levels is None else self.levels[idx]
+        self.level = level  # el LevelData en juego (las grabaciones lo guardan entero)
+        # Contador de cerdos vivos y umbrales de estrellas: 3 estrellas usando
+        # a lo sumo un pájaro por cerdo, una menos por cada pájaro extra
+        num_pigs = len(level.pigs)
+        self.pigs_left = num_pigs
+        self.birds_launched = 0
+        self.star_thresholds = (num_pigs, num_pigs + 1, num_pigs + 2)
+        self.level_complete = False
+        self.stars = None
+        for x, y in level.columns:
+            self.add_object(Column(x, y, self.space))
+        for x, y in level.pigs:
+            self.add_object(Pig(x, y, self.space))
+
+    def clear_level(self):
+        """
+        Saca del espacio todos los bodies y shapes que pertenecen al nivel
+        (columnas, cerdos, pájaros y la rampa de la catapulta). El piso, las
+        paredes y el soporte de la catapulta se reutilizan.
+        """
+        for obj in list(self.registry.by_shape.values()):
+            self.remove_object(obj)
+        self.catapult.reset()
+
+    @property
+    def birds(self):
+        return self.registry.birds
+
+    def add_object(self, obj):
+        """Registra un objeto ya agregado al espacio y lo pone en la lista de dibujo."""
+        self.registry.add(obj)
+        if not obj.sprite_lists:
+            self.sprites.append(obj)
+
+    def remove_object(self, obj):
+        """
+        Saca un objeto del índice, de las listas de sprites y del espacio.
+        Retorna False si ya había sido removido.
+        """
+        removed = self.registry.remove(obj)
+        obj.remove_from_sprite_lists()
+        if removed and isinstance(obj, Bird):
+            # el pool lo saca del espacio y lo guarda para el próximo lanzamiento
+            self.bird_pool.release(obj)
+        elif obj.shape.space is not None:
+            obj.shape.space.remove(obj.shape, obj.body)
+        return removed
+
+    def bird_hits_pig(self, arbiter, space, data):
+        # Corre dentro de space.step: solo anota el choque, el cerdo se
+        # elimina en process_collision_events
+        bird_shape, pig_shape = arbiter.shapes
+        pig_hit = self.registry.get_pig(pig_shape)
+        if pig_hit:
+            a, b = bird_shape.body, pig_shape.body
+            # impulso estimado con la velocidad de acercamiento y la masa reducida
+            ma, mb = a.mass, b.mass
+            reduced = mb if math.isinf(ma) else ma if math.isinf(mb) else ma * mb / (ma + mb)
+            impulse = abs((b.velocity - a.velocity).dot(arbiter.normal)) * reduced
+            points = arbiter.contact_point_set.points
+            x, y = points[0].point_a if points else b.position
+            self.collision_events.append(
+                CollisionEvent(BIRD_PIG, self.registry.get(bird_shape), pig_hit, impulse, x, y))
+        return True
+
+    def process_collision_events(self):
+        """
+        Aplica los choques anotados durante el paso: un cerdo con varios
+        contactos (o también cercano a un pájaro) muere una sola vez.
+        Retorna la cantidad de cerdos eliminados.
+        """
+        events = self.collision_events
+        if not events:
+            return 0
+        self.collision_events = []
+        pigs_hit = {}
+        for event in events:
+            if event.kind == BIRD_PIG and event.b not in pigs_hit:
+                pigs_hit[event.b] = event
+        for pig in pigs_hit:
+            self.kill_pig(pig)
+        return len(pigs_hit)
+
+    def pigs_touching_birds(self):
+        """
+        Pares (pájaro, cerdo) con el centro del cerdo a menos de PIG_KILL_DISTANCE
+        del centro del pájaro.
+        Usa el índice espacial de pymunk: cada pájaro consulta solo las shapes que
+        contienen su centro, en vez de compararse contra todos los cerdos.
+        """
+        found = {}
+        for bird in self.registry.birds:
+            center = bird.body.position
+            for info in self.space.point_query(center, 0, pymunk.ShapeFilter()):
+                pig = self.registry.get_pig(info.shape)
+                if pig is not None and pig not in found and \
+                        pig.body.position.get_distance(center) <= PIG_KILL_DISTANCE:
+                    found[pig] = bird
+        return [(bird, pig) for pig, bird in found.items()]
+
+    def kill_pig(self, pig):
+        # único camino para eliminar cerdos: mantiene el contador al día
+        x, y = pig.center_x, pig.center_y
+        if not self.remove_object(pig):
+            return
+        self.score += 100
+        self.floating_scores.append({'x': x, 'y': y, 'value': 100, 'timer': 0.0})
+        self.pigs_left -= 1
+        if self.pigs_left <= 0:
+            self.complete_level()
+
+    def complete_level(self):
+        if self.level_complete:
+            return
+        self.level_complete = True
+        self.stars = self.compute_stars(self.birds_launched)
+        logger.debug(f"Nivel {self.level_idx + 1} completado con {self.stars} estrellas")
+        if self.on_level_complete:
+            self.on_level_complete(self.stars)
+
+    def compute_stars(self, birds_used):
+        for stars, limit in zip((3, 2, 1), self.star_thresholds):
+            if birds_used <= limit:
+                return stars
+        return 0
+
+    def create_bird(self, bird_type, impulse_vector, x, y):
+        # crear pajaro del tipo que queremos
+        # Llevar la cuenta de pájaros lanzados
+        self.birds_launched += 1
+        bird = self.bird_pool.acquire(bird_type, impulse_vector, x, y)
+        self.add_object(bird)
+        self.current_bird = bird
+        return bird
+
+    def launch_bird(self, bird_type, impulse_vector, x, y):
+        """Dispara un pájaro con la resortera y bloquea el turno hasta que se detenga."""
+        bird = self.create_bird(bird_type, impulse_vector, x, y)
+        self.can_launch = False
+        return bird
+
+    def shoot(self, bird_type, angle, impulse):
+        """
+        Dispara como si el jugador soltara la resortera con ese ángulo de salida
+        (radianes) e impulso: el pájaro aparece en el punto de soltado.
+        """
+        start = Point2D(*SLING_START)
+        end = Point2D(start.x - impulse * math.cos(angle), start.y - impulse * math.sin(angle))
+        return self.launch_bird(bird_type, get_impulse_vector(start, end), end.x, end.y)
+
+    def load_catapult_bird(self, bird_type, x, y):
+        bird = self.create_bird(bird_type, ImpulseVector(0, 0), x, y)
+        self.catapult.load_bird(bird)
+        self.catapult_bird_ready = True
+        self.can_launch = True
+        return bird
+
+    def drop_catapult_bird(self, x, y, height=400):
+        ok = self.catapult.drop_bird_at(x, y, height=height)
+        if ok:
+            self.can_launch = False
+        return ok
+
+    def toggle_catapult_mode(self):
+        # cambiar entre resortera y catapulta
+        self.catapult_mode = not self.catapult_mode
+        logger.debug(f"Catapult mode: {self.catapult_mode}")
+        # resetear catapulta
+        self.catapult_bird_ready = False
+        self.can_launch = True
+
+    def use_ability(self):
+        # usar habilidad especial
+        if not self.current_bird:
+            return False
+        if isinstance(self.current_bird, YellowBird):
+            if self.current_bird.is_in_flight:
+                boosted = self.current_bird.boost()
+                logger.debug("Yellow bird boosted!")
+                return boosted
+        elif isinstance(self.current_bird, BlueBird):
+            if self.current_bird.is_in_flight:
+                parent = self.current_bird
+                # los hijos salen del pool antes de devolver al padre, así
+                # ninguno de ellos es el mismo objeto que current_bird
+                new_birds = parent.split(lambda iv, x, y: self.bird_pool.acquire("blue", iv, x, y))
+                for new_bird in new_birds:
+                    self.add_object(new_bird)
+                if new_birds:
+                    self.remove_object(parent)
+                    logger.debug(f"Blue bird split into {len(new_birds)} birds!")
+                return bool(new_birds)
+        return False
+
+    def advance(self, delta_time: float) -> int:
+        """
+        Avanza la simulación según el tiempo real transcurrido usando pasos fijos.
+        Si el cuadro tardó demasiado se ejecutan como máximo `max_steps_per_frame`
+        pasos y el resto del tiempo se descarta. Retorna los pasos ejecutados.
+        """
+        self.accumulator += delta_time
+        steps = 0
+        while self.accumulator >= self.physics_dt and steps < self.max_steps_per_frame:
+            self.tick(self.physics_dt)
+            self.accumulator -= self.physics_dt
+            steps += 1
+        if self.accumulator >= self.physics_dt:
+            dropped = int(self.accumulator / self.physics_dt)
+            self.dropped_steps += dropped
+            logger.debug(f"Frame hitch: dropping {dropped} physics steps")
+            self.accumulator -= dropped * self.physics_dt
+        self.frame_steps = steps
+        return steps
+
+    def tick(self, delta_time: float):
+        """Un paso fijo de simulación: física, sprites y reglas."""
+        profiler = self.profiler
+        self.total_steps += 1
+        with profiler.phase("physics"):
+            self.space.step(delta_time)
+            self.process_collision_events()
+        with profiler.phase("sprites_update"):
+            # posiciones de todos los cuerpos en bloque; solo los pájaros
+            # tienen lógica propia por cuadro
+            self.sprite_sync.sync(self.space)
+            for bird in self.registry.birds:
+                bird.update(delta_time)
+        # retirar pájaros cuyo tiempo de vida terminó
+        expired = [bird for bird in self.registry.birds if bird.expired]
+        for bird in expired:
+            self.remove_object(bird)
+        self.cull_out_of_bounds()
+        if self.catapult_mode:
+            self.catapult.update(delta_time)
+        with profiler.phase("check_bird_status"):
+            self.check_bird_status(delta_time)
+        # Eliminar cerdos si un pájaro está muy cerca (1mm)
+        with profiler.phase("proximity"):
+            for bird, pig in self.pigs_touching_birds():
+                x, y = pig.body.position
+                self.collision_events.append(CollisionEvent(BIRD_PIG, bird, pig, 0.0, x, y))
+            self.process_collision_events()
+        # Actualizar efectos flotantes de puntaje
+        for fs in self.floating_scores:
+            fs['y'] += 60 * delta_time  # sube
+            fs['timer'] += delta_time
+        self.floating_scores = [fs for fs in self.floating_scores if fs['timer'] < 1.0]
+
+    def cull_out_of_bounds(self):
+        """
+        Retira todo lo que salió por completo de `bounds`: pájaros (vuelven al
+        pool y el turno termina), columnas despedidas y cerdos caídos, que
+        cuentan como muertos.
+        """
+        bounds = self.bounds
+        culled = 0
+        for obj in self.sprite_sync.outside(bounds):
+            if obj not in self.registry or bounds.intersects(obj.shape.bb):
+                continue
+            if obj in self.registry.pigs:
+                self.kill_pig(obj)
+            else:
+                self.remove_object(obj)
+            culled += 1
+        return culled
+
+    def step(self, steps=1):
+        """Avanza la simulación `steps` pasos fijos, sin importar el tiempo real."""
+        for _ in range(steps):
+            self.tick(self.physics_dt)
+
+    def check_level_win(self):
+        """Retorna las estrellas ganadas si el nivel se completó, o None si sigue."""
+        return self.stars if self.level_complete else None
+
+    def check_bird_status(self, delta_time: float):
+        # ver si el pajaro ya se detuvo para poder lanzar otro
+        if self.current_bird and not self.can_launch:
+            if self.current_bird not in self.birds:
+                # pajaro fue destruido o salió de los límites del mundo, se puede lanzar otro
+                logger.debug("Bird was removed, can launch next bird")
+            elif self.current_bird.body.is_sleeping:
+                # pymunk lo durmió: lleva SLEEP_TIME_THRESHOLD segundos quieto
+                logger.debug("Bird has stopped, can launch next bird")
+            else:
+                return
+            self.can_launch = True
+            self.current_bird = None
+
+    def restart_level(self):
+        # resetear estado
+        self.current_bird = None
+        self.can_launch = True
+        self.catapult_bird_ready = False
+
+        # recargar nivel
+        self.load_level(self.level_idx)
+        logger.debug(f"Nivel {self.level_idx + 1} reiniciado")